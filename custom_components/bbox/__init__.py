@@ -6,36 +6,60 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.const import Platform
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
+from .client import async_get_client_registry
+from .const import CONF_BASE_URL, DOMAIN, STORAGE_VERSION
 from .coordinator import BboxDataUpdateCoordinator
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.DEVICE_TRACKER]
+PLATFORMS: list[Platform] = [Platform.DEVICE_TRACKER, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the Bbox integration."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Bbox from a config entry."""
     coordinator = BboxDataUpdateCoordinator(hass, entry)
 
-    try:
-        await coordinator._async_setup()
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        raise ConfigEntryNotReady(f"Failed to connect to Bbox: {err}") from err
+    # Start from the last known data and refresh in the background if possible
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
+        try:
+            await coordinator._async_setup()
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryAuthFailed:
+            raise
+        except Exception as err:
+            raise ConfigEntryNotReady(f"Failed to connect to Bbox: {err}") from err
 
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    coordinator.scheduler.async_register(entry.entry_id)
 
     # Forward entry setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_first_refresh"
+        )
+
     return True
 
 
@@ -46,3 +70,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await coordinator.async_shutdown()
 
     return unload_ok  # type: ignore
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted data and API client of a config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+    await async_get_client_registry(hass).async_close(entry.data[CONF_BASE_URL])
@@ -0,0 +1,187 @@
+"""Shared API clients for Bbox integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import CLIENT_RELEASE_DELAY, DATA_CLIENTS
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from aiobbox.client import BboxApi
+    from aiobbox.models import Router
+
+
+def normalize_base_url(base_url: str) -> str:
+    """Return the base URL with a trailing slash."""
+    if not base_url.endswith("/"):
+        base_url = base_url + "/"
+    return base_url
+
+
+class BboxClient:
+    """An authenticated API client and the router info it last fetched."""
+
+    def __init__(self, api: BboxApi, password: str, router: Router | None) -> None:
+        """Initialize the client."""
+        self.api: BboxApi = api
+        self.password: str = password
+        self.router: Router | None = router
+        self.in_use: bool = False
+        self.cancel_close: CALLBACK_TYPE | None = None
+
+
+class BboxClientRegistry:
+    """Share authenticated API clients by base URL.
+
+    The Bbox rate-limits logins, so a client authenticated by a config flow is
+    handed over to the config entry, and a client released by an unloaded entry
+    is kept alive for a short while so that a reload does not log in again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self._hass = hass
+        self._clients: dict[str, BboxClient] = {}
+        # Clients waiting for a loaded entry to release the one they replace
+        self._pending: dict[str, BboxClient] = {}
+
+    def _get(self, base_url: str, password: str) -> BboxClient | None:
+        """Return the client for a base URL if the password matches."""
+        client = self._clients.get(normalize_base_url(base_url))
+        if client is None or client.password != password:
+            return None
+        return client
+
+    @callback
+    def async_get(self, base_url: str, password: str) -> BboxApi | None:
+        """Return the live client for a base URL, without taking it over."""
+        client = self._get(base_url, password)
+        return client.api if client is not None else None
+
+    @callback
+    def async_in_use(self, base_url: str, api: BboxApi) -> bool:
+        """Return whether a loaded entry uses the client."""
+        client = self._clients.get(normalize_base_url(base_url))
+        return client is not None and client.api is api and client.in_use
+
+    @callback
+    def async_acquire(
+        self, base_url: str, password: str
+    ) -> tuple[BboxApi, Router | None] | None:
+        """Take over the live client for a base URL and its pending router info."""
+        if (client := self._get(base_url, password)) is None:
+            return None
+        if client.cancel_close is not None:
+            client.cancel_close()
+            client.cancel_close = None
+        client.in_use = True
+        router, client.router = client.router, None
+        return client.api, router
+
+    @callback
+    def async_register(
+        self,
+        base_url: str,
+        password: str,
+        api: BboxApi,
+        router: Router | None = None,
+        *,
+        in_use: bool = False,
+    ) -> None:
+        """Register a client, closing the one it replaces.
+
+        A client still used by a loaded entry, as during a reauth, is replaced
+        only once the entry releases it. Clients nobody uses are closed after
+        CLIENT_RELEASE_DELAY unless an entry acquires them first.
+        """
+        key = normalize_base_url(base_url)
+        client = BboxClient(api, password, router)
+        client.in_use = in_use
+        if (previous := self._clients.get(key)) is not None:
+            if previous.api is api:
+                previous.router = router or previous.router
+                return
+            if previous.in_use:
+                if (pending := self._pending.pop(key, None)) is not None:
+                    self._async_close_client(pending)
+                self._pending[key] = client
+                if not in_use:
+                    self._async_schedule_close(key, client)
+                return
+            self._async_close_client(previous)
+
+        self._clients[key] = client
+        if not in_use:
+            self._async_schedule_close(key, client)
+
+    @callback
+    def async_release(self, base_url: str, api: BboxApi) -> None:
+        """Release a client, it is closed unless acquired again shortly.
+
+        A client registered while this one was in use replaces it right away.
+        """
+        key = normalize_base_url(base_url)
+        if (client := self._clients.get(key)) is None or client.api is not api:
+            return
+        client.in_use = False
+        if (pending := self._pending.pop(key, None)) is not None:
+            self._clients[key] = pending
+            self._async_close_client(client)
+            return
+        self._async_schedule_close(key, client)
+
+    async def async_close(self, base_url: str) -> None:
+        """Close the clients for a base URL right away."""
+        key = normalize_base_url(base_url)
+        for clients in (self._pending, self._clients):
+            if (client := clients.pop(key, None)) is None:
+                continue
+            if client.cancel_close is not None:
+                client.cancel_close()
+            await client.api.close()
+
+    @callback
+    def _async_schedule_close(self, key: str, client: BboxClient) -> None:
+        """Close a client after CLIENT_RELEASE_DELAY if still unused."""
+        if client.cancel_close is not None:
+            return
+
+        @callback
+        def _async_close(_: datetime) -> None:
+            client.cancel_close = None
+            if client.in_use:
+                return
+            if self._clients.get(key) is client:
+                del self._clients[key]
+                self._async_close_client(client)
+            elif self._pending.get(key) is client:
+                del self._pending[key]
+                self._async_close_client(client)
+
+        client.cancel_close = async_call_later(
+            self._hass, CLIENT_RELEASE_DELAY, _async_close
+        )
+
+    @callback
+    def _async_close_client(self, client: BboxClient) -> None:
+        """Close a client in the background."""
+        if client.cancel_close is not None:
+            client.cancel_close()
+            client.cancel_close = None
+        self._hass.async_create_background_task(
+            client.api.close(), f"{DATA_CLIENTS}_close"
+        )
+
+
+@callback
+def async_get_client_registry(hass: HomeAssistant) -> BboxClientRegistry:
+    """Return the client registry, creating it if needed."""
+    registry: BboxClientRegistry | None = hass.data.get(DATA_CLIENTS)
+    if registry is None:
+        registry = hass.data[DATA_CLIENTS] = BboxClientRegistry(hass)
+    return registry
@@ -11,45 +11,100 @@ from aiobbox.exceptions import (
     BboxApiError,
     BboxInvalidCredentialsError,
     BboxRateLimitError,
+    BboxSessionExpiredError,
     BboxTimeoutError,
+    BboxUnauthenticatedError,
+)
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlowWithReload,
 )
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_PASSWORD
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    TextSelector,
+    TextSelectorConfig,
+)
 
-from .const import CONF_BASE_URL, DEFAULT_BASE_URL, DOMAIN
+from .client import async_get_client_registry, normalize_base_url
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_BASE_URL,
+    CONF_DEPARTURE_GRACE,
+    CONF_DEVICE_TYPES,
+    CONF_EXCLUDE_HOSTNAMES,
+    CONF_EXCLUDE_MACS,
+    CONF_GUEST_FILTER,
+    CONF_INCLUDE_MACS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_BASE_URL,
+    DEFAULT_DEPARTURE_GRACE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
+from .filters import GuestFilter, is_mac_address
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from aiobbox.models import Router
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def _async_login(
+    hass: HomeAssistant, base_url: str, password: str
+) -> tuple[BboxApi, Router]:
+    """Log in with a new client and fetch the router info."""
+    api = BboxApi(
+        password=password,
+        base_url=base_url,
+        session=async_get_clientsession(hass),
+    )
+    try:
+        await api.authenticate()
+        return api, await api.get_router_info()
+    except BaseException:
+        await api.close()
+        raise
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, str]:
     """Validate the user input allows us to connect.
 
     Data has the keys from DATA_SCHEMA with values provided by the user.
     """
-    session = async_get_clientsession(hass)
-    base_url = data[CONF_BASE_URL]
-
-    # Ensure URL ends with /
-    if not base_url.endswith("/"):
-        base_url = base_url + "/"
+    registry = async_get_client_registry(hass)
+    base_url = normalize_base_url(data[CONF_BASE_URL])
+    password = data[CONF_PASSWORD]
 
-    api = BboxApi(
-        password=data[CONF_PASSWORD],
-        base_url=base_url,
-        session=session,
-    )
+    # Reuse a live client for this router rather than logging in again
+    if (api := registry.async_get(base_url, password)) is None:
+        api, router = await _async_login(hass, base_url, password)
+    else:
+        try:
+            router = await api.get_router_info()
+        except (BboxSessionExpiredError, BboxUnauthenticatedError):
+            if registry.async_in_use(base_url, api):
+                # The entry using the client logs it in again, do not race it
+                api, router = await _async_login(hass, base_url, password)
+            else:
+                await api.authenticate()
+                router = await api.get_router_info()
 
-    try:
-        await api.authenticate()
-        router = await api.get_router_info()
-    finally:
-        await api.close()
+    # Hand the authenticated client and router info over to the config entry
+    registry.async_register(base_url, password, api, router)
 
     # Return info that you want to store in the config entry.
     return {
@@ -63,6 +118,12 @@ class BboxConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> BboxOptionsFlow:  # noqa: ARG004
+        """Get the options flow for this handler."""
+        return BboxOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -149,3 +210,131 @@ class BboxConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore
             data_schema=vol.Schema({vol.Required(CONF_PASSWORD): str}),
             errors=errors,
         )
+
+
+class BboxOptionsFlow(OptionsFlowWithReload):
+    """Handle Bbox options."""
+
+    def __init__(self) -> None:
+        """Initialize the options flow."""
+        self._options: dict[str, Any] = {}
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the polling options."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors["base"] = "invalid_interval"
+            else:
+                self._options.update(user_input)
+                return await self.async_step_filters()
+
+        options = self.config_entry.options
+        interval = vol.All(vol.Coerce(int), vol.Range(min=1))
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_SCAN_INTERVAL, int(DEFAULT_SCAN_INTERVAL.total_seconds())
+                    ),
+                ): interval,
+                vol.Required(
+                    CONF_ADAPTIVE_POLLING,
+                    default=options.get(
+                        CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                    ),
+                ): bool,
+                vol.Required(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_MIN_SCAN_INTERVAL,
+                        int(DEFAULT_MIN_SCAN_INTERVAL.total_seconds()),
+                    ),
+                ): interval,
+                vol.Required(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_SCAN_INTERVAL,
+                        int(DEFAULT_MAX_SCAN_INTERVAL.total_seconds()),
+                    ),
+                ): interval,
+                vol.Required(
+                    CONF_DEPARTURE_GRACE,
+                    default=options.get(
+                        CONF_DEPARTURE_GRACE,
+                        int(DEFAULT_DEPARTURE_GRACE.total_seconds()),
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=data_schema,
+            errors=errors,
+        )
+
+    async def async_step_filters(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the filters selecting the tracked hosts."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            macs = [*user_input[CONF_INCLUDE_MACS], *user_input[CONF_EXCLUDE_MACS]]
+            if not all(is_mac_address(mac) for mac in macs):
+                errors["base"] = "invalid_mac"
+            else:
+                self._options.update(user_input)
+                return self.async_create_entry(data=self._options)
+
+        options = self.config_entry.options
+        # Offer the device types the router reports, others can be typed in
+        device_types = set(options.get(CONF_DEVICE_TYPES, ()))
+        coordinator = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if coordinator is not None:
+            device_types.update(
+                host.devicetype
+                for host in coordinator.data.hosts_by_mac.values()
+                if host.devicetype
+            )
+        text_list = TextSelector(TextSelectorConfig(multiple=True))
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_INCLUDE_MACS, default=options.get(CONF_INCLUDE_MACS, [])
+                ): text_list,
+                vol.Required(
+                    CONF_EXCLUDE_MACS, default=options.get(CONF_EXCLUDE_MACS, [])
+                ): text_list,
+                vol.Required(
+                    CONF_EXCLUDE_HOSTNAMES,
+                    default=options.get(CONF_EXCLUDE_HOSTNAMES, []),
+                ): text_list,
+                vol.Required(
+                    CONF_GUEST_FILTER,
+                    default=options.get(CONF_GUEST_FILTER, GuestFilter.ALL),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=list(GuestFilter), translation_key=CONF_GUEST_FILTER
+                    )
+                ),
+                vol.Required(
+                    CONF_DEVICE_TYPES, default=options.get(CONF_DEVICE_TYPES, [])
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=sorted(device_types), multiple=True, custom_value=True
+                    )
+                ),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="filters",
+            data_schema=data_schema,
+            errors=errors,
+        )
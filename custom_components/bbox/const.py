@@ -5,13 +5,73 @@ from typing import Final
 
 DOMAIN: Final[str] = "bbox"
 
+# hass.data key of the API clients shared between config flows and entries
+DATA_CLIENTS: Final[str] = f"{DOMAIN}_clients"
+# hass.data key of the scheduler shared by all config entries
+DATA_SCHEDULER: Final[str] = f"{DOMAIN}_scheduler"
+
 # Configuration constants
 CONF_BASE_URL: Final[str] = "base_url"
 CONF_PASSWORD: Final[str] = "password"
 
+# Option constants
+CONF_SCAN_INTERVAL: Final[str] = "scan_interval"
+CONF_ADAPTIVE_POLLING: Final[str] = "adaptive_polling"
+CONF_MIN_SCAN_INTERVAL: Final[str] = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL: Final[str] = "max_scan_interval"
+CONF_DEPARTURE_GRACE: Final[str] = "departure_grace"
+# Host filter options, hosts left out are never indexed or tracked
+CONF_INCLUDE_MACS: Final[str] = "include_macs"
+CONF_EXCLUDE_MACS: Final[str] = "exclude_macs"
+CONF_EXCLUDE_HOSTNAMES: Final[str] = "exclude_hostnames"
+CONF_GUEST_FILTER: Final[str] = "guest_filter"
+CONF_DEVICE_TYPES: Final[str] = "device_types"
+
 # Default values
 DEFAULT_BASE_URL: Final[str] = "https://mabbox.bytel.fr/api/v1/"
 DEFAULT_SCAN_INTERVAL: Final[timedelta] = timedelta(seconds=30)
+DEFAULT_ADAPTIVE_POLLING: Final[bool] = False
+DEFAULT_MIN_SCAN_INTERVAL: Final[timedelta] = timedelta(seconds=5)
+DEFAULT_MAX_SCAN_INTERVAL: Final[timedelta] = timedelta(minutes=5)
+# Hosts are marked away as soon as the router reports them gone by default
+DEFAULT_DEPARTURE_GRACE: Final[timedelta] = timedelta(0)
+
+# Firmware, serial number and boot count rarely change, poll them less often
+ROUTER_INFO_SCAN_INTERVAL: Final[timedelta] = timedelta(hours=1)
+
+# WAN byte counters are polled on their own, faster cadence
+WAN_STATS_SCAN_INTERVAL: Final[timedelta] = timedelta(seconds=10)
+# Number of counter intervals averaged for the WAN throughput sensors
+THROUGHPUT_BUFFER_SIZE: Final[int] = 30
+
+# Persisted snapshot of the last good data, used for instant startup
+STORAGE_VERSION: Final[int] = 1
+SNAPSHOT_SAVE_INTERVAL: Final[timedelta] = timedelta(minutes=10)
+
+# Router requests in flight at once, across all config entries
+MAX_CONCURRENT_REQUESTS: Final[int] = 4
+# Dispatcher signal sent when presence across routers changed, formatted with
+# the MAC
+SIGNAL_PRESENCE_UPDATED: Final[str] = f"{DOMAIN}_presence_updated_{{}}"
+
+# How long an unloaded entry's client is kept alive for a reload to reuse it
+CLIENT_RELEASE_DELAY: Final[timedelta] = timedelta(minutes=1)
+
+# Backoff and circuit breaker applied while the router fails
+BACKOFF_JITTER: Final[float] = 0.5
+RATE_LIMIT_BACKOFF: Final[timedelta] = timedelta(minutes=1)
+BREAKER_FAILURE_THRESHOLD: Final[int] = 5
+BREAKER_PROBE_INTERVAL: Final[timedelta] = timedelta(minutes=5)
+# Dispatcher signal sent when the breaker changes, formatted with the entry ID
+SIGNAL_BREAKER_UPDATED: Final[str] = f"{DOMAIN}_breaker_updated_{{}}"
+
+# Factor applied to the polling interval after each quiet adaptive poll
+ADAPTIVE_BACKOFF_FACTOR: Final[float] = 2.0
+
+# Granularity of the last_seen attribute, keeps it stable across polls
+LAST_SEEN_RESOLUTION: Final[timedelta] = timedelta(minutes=5)
+# Granularity of the router boot time, absorbs jitter between now and uptime
+BOOT_TIME_RESOLUTION: Final[timedelta] = timedelta(minutes=1)
 
 # Device tracker attributes
 ATTR_CONNECTION_TYPE: Final[str] = "connection_type"
@@ -27,6 +87,14 @@ ATTR_SIGNAL_STRENGTH: Final[str] = "signal_strength"
 ATTR_CONNECTION_SPEED: Final[str] = "connection_speed"
 ATTR_IPV6_ADDRESSES: Final[str] = "ipv6_addresses"
 
+# Wi-Fi bands reported by the router and the slug used in sensor keys
+WIFI_BANDS: Final[dict[float, str]] = {2.4: "2_4ghz", 5.0: "5ghz", 6.0: "6ghz"}
+# Clients below this RSSI in dBm are counted as having a weak signal
+WEAK_SIGNAL_RSSI: Final[int] = -75
+
+# Number of hosts listed by the top talkers sensor
+TOP_TALKERS_COUNT: Final[int] = 5
+
 # Router attributes
 ATTR_MODEL_NAME: Final[str] = "model_name"
 ATTR_SERIAL_NUMBER: Final[str] = "serial_number"
@@ -36,3 +104,36 @@ ATTR_NUMBER_OF_BOOTS: Final[str] = "number_of_boots"
 ATTR_WAN_IP: Final[str] = "wan_ip"
 ATTR_BANDWIDTH_UP: Final[str] = "bandwidth_up"
 ATTR_BANDWIDTH_DOWN: Final[str] = "bandwidth_down"
+ATTR_TOP_TALKERS: Final[str] = "top_talkers"
+
+# Bus event fired once per refresh with the hosts that arrived and departed
+EVENT_PRESENCE_CHANGED: Final[str] = f"{DOMAIN}_presence_changed"
+ATTR_ARRIVED: Final[str] = "arrived"
+ATTR_DEPARTED: Final[str] = "departed"
+
+# Device trigger types, named after the presence event list they fire from
+TRIGGER_TYPES: Final[frozenset[str]] = frozenset({ATTR_ARRIVED, ATTR_DEPARTED})
+
+# Services
+SERVICE_GET_USAGE_RANKING: Final[str] = "get_usage_ranking"
+SERVICE_START_TRACE: Final[str] = "start_trace"
+SERVICE_STOP_TRACE: Final[str] = "stop_trace"
+
+# Performance statistics are kept over this many samples
+PERF_WINDOW: Final[int] = 100
+# Upper bounds in seconds of the timing histogram buckets
+PERF_HISTOGRAM_BUCKETS: Final[tuple[float, ...]] = (
+    0.001,
+    0.01,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Response fields replaced at any depth in recorded traces, matched in lowercase
+TRACE_REDACT: Final[frozenset[str]] = frozenset({"serialnumber", "duid"})
@@ -2,41 +2,217 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, timedelta
+from enum import StrEnum
+from functools import cached_property
+from pathlib import Path
+from typing import Any, TypeVar
 
 from aiobbox.client import BboxApi
 from aiobbox.exceptions import (
     BboxApiError,
+    BboxInvalidCredentialsError,
+    BboxRateLimitError,
     BboxSessionExpiredError,
     BboxTimeoutError,
     BboxUnauthenticatedError,
 )
-from aiobbox.models import Host, Router
+from aiobbox.models import Host, Router, WANIPStats
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID, CONF_PASSWORD
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_BASE_URL, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .client import async_get_client_registry
+from .const import (
+    ADAPTIVE_BACKOFF_FACTOR,
+    ATTR_ARRIVED,
+    ATTR_BANDWIDTH_DOWN,
+    ATTR_BANDWIDTH_UP,
+    ATTR_DEPARTED,
+    BACKOFF_JITTER,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_PROBE_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BASE_URL,
+    CONF_DEPARTURE_GRACE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DEPARTURE_GRACE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    EVENT_PRESENCE_CHANGED,
+    RATE_LIMIT_BACKOFF,
+    ROUTER_INFO_SCAN_INTERVAL,
+    SIGNAL_BREAKER_UPDATED,
+    SNAPSHOT_SAVE_INTERVAL,
+    STORAGE_VERSION,
+    THROUGHPUT_BUFFER_SIZE,
+    TOP_TALKERS_COUNT,
+    WAN_STATS_SCAN_INTERVAL,
+)
+from .filters import HostFilter
+from .host import BboxHost
+from .occupancy import NetworkOccupancy, top_talkers
+from .perf import PerfStats
+from .scheduler import BboxScheduler, async_get_scheduler
+from .throughput import CounterRingBuffer, ThroughputRates
+from .trace import TraceRecorder
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_HostT = TypeVar("_HostT", Host, BboxHost)
+
+
+class BreakerState(StrEnum):
+    """State of the polling circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
 
 class BboxData:
     """Class to hold Bbox data."""
 
-    def __init__(self, router: Router, hosts: list[Host]) -> None:
-        """Initialize Bbox data."""
+    def __init__(
+        self, router: Router, hosts: Iterable[BboxHost], now: datetime
+    ) -> None:
+        """Initialize Bbox data.
+
+        `now` is the router clock at the time hosts were fetched.
+        """
         self.router: Router = router
-        self.hosts: list[Host] = hosts
+        self.now: datetime = now
+        # Index hosts by normalized MAC once per refresh so entity lookups are O(1)
+        self.hosts_by_mac: dict[str, BboxHost] = {host.mac: host for host in hosts}
+        # MACs whose host appeared, disappeared or changed since the previous refresh
+        self.changed_macs: set[str] = set(self.hosts_by_mac)
+        # Subset of changed MACs that arrived, departed or got a new address
+        self.presence_changes: set[str] = set()
+        # MACs of the hosts that connected or disconnected since the previous refresh
+        self.arrived: list[str] = []
+        self.departed: list[str] = []
+
+    @classmethod
+    def from_api(
+        cls, router: Router, hosts: Iterable[Host], now: datetime | None = None
+    ) -> BboxData:
+        """Build data from the router info and hosts returned by the API.
+
+        `now` defaults to the clock reported with the router info.
+        """
+        if now is None:
+            now = router.now
+        return cls(router, (BboxHost.from_host(host, now) for host in hosts), now)
+
+    def diff(self, previous: BboxData) -> None:
+        """Restrict changed MACs to the hosts that differ from a previous refresh."""
+        old = previous.hosts_by_mac
+        self.changed_macs = {
+            mac
+            for mac, host in self.hosts_by_mac.items()
+            if (old_host := old.get(mac)) is None
+            or old_host.fingerprint != host.fingerprint
+        }
+        self.changed_macs.update(old.keys() - self.hosts_by_mac.keys())
+
+        self.presence_changes = set()
+        for mac in self.changed_macs:
+            old_host = old.get(mac)
+            new_host = self.hosts_by_mac.get(mac)
+            if (
+                old_host is None
+                or new_host is None
+                or old_host.active != new_host.active
+                or old_host.ipaddress != new_host.ipaddress
+            ):
+                self.presence_changes.add(mac)
+
+            was_active = old_host is not None and old_host.active
+            is_active = new_host is not None and new_host.active
+            if is_active and not was_active:
+                self.arrived.append(mac)
+            elif was_active and not is_active:
+                self.departed.append(mac)
+
+    def presence_event_data(
+        self, previous: BboxData, arrived: list[str], departed: list[str]
+    ) -> dict[str, Any]:
+        """Return the merged arrivals and departures in bus event form."""
+
+        def _describe(host: BboxHost | None, mac: str) -> dict[str, Any]:
+            return {
+                "mac": mac,
+                "hostname": host.hostname if host else None,
+                "ip": host.ipaddress if host else None,
+            }
+
+        return {
+            ATTR_ARRIVED: [
+                _describe(self.hosts_by_mac.get(mac), mac) for mac in arrived
+            ],
+            ATTR_DEPARTED: [
+                _describe(
+                    self.hosts_by_mac.get(mac) or previous.hosts_by_mac.get(mac), mac
+                )
+                for mac in departed
+            ],
+        }
+
+    @cached_property
+    def occupancy(self) -> NetworkOccupancy:
+        """Return the aggregate occupancy, computed once per refresh."""
+        return NetworkOccupancy(self.hosts_by_mac.values())
+
+    @cached_property
+    def top_talkers(self) -> list[dict[str, Any]]:
+        """Return the hosts with the highest usage, computed once per refresh."""
+        return top_talkers(self.hosts_by_mac.values(), TOP_TALKERS_COUNT)
+
+    def get_host(self, mac: str) -> BboxHost | None:
+        """Return the host with the given MAC address, if present."""
+        return self.hosts_by_mac.get(format_mac(mac))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable snapshot of the data."""
+        return {
+            "router": self.router.model_dump(mode="json"),
+            "hosts": [host.as_dict() for host in self.hosts_by_mac.values()],
+            "now": self.now.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BboxData:
+        """Restore data from a snapshot created by as_dict."""
+        return cls(
+            router=Router.model_validate(data["router"]),
+            hosts=[BboxHost.from_dict(host) for host in data["hosts"]],
+            now=datetime.fromisoformat(data["now"]),
+        )
 
 
 class BboxDataUpdateCoordinator(DataUpdateCoordinator[BboxData]):
     """Class to manage fetching Bbox data from the router."""
 
     config_entry: ConfigEntry
+    data: BboxData
 
     def __init__(
         self,
@@ -44,16 +220,76 @@ class BboxDataUpdateCoordinator(DataUpdateCoordinator[BboxData]):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the coordinator."""
+        options = entry.options
+        interval = timedelta(
+            seconds=options.get(
+                CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL.total_seconds()
+            )
+        )
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=DEFAULT_SCAN_INTERVAL,
+            update_interval=interval,
         )
         self.config_entry = entry
         self._api: BboxApi | None = None
         self._base_url: str = entry.data[CONF_BASE_URL]
         self._password: str = entry.data[CONF_PASSWORD]
+        # Adaptive polling between the minimum and maximum scan intervals
+        self._adaptive: bool = options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        self._min_scan_interval = timedelta(
+            seconds=options.get(
+                CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL.total_seconds()
+            )
+        )
+        self._max_scan_interval = timedelta(
+            seconds=options.get(
+                CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL.total_seconds()
+            )
+        )
+        # Polling interval while the router is healthy
+        self._interval = interval
+        # Hosts gone for less than the grace period are still reported
+        # connected, keyed by MAC with the router time they were last seen at
+        self._departure_grace = timedelta(
+            seconds=options.get(
+                CONF_DEPARTURE_GRACE, DEFAULT_DEPARTURE_GRACE.total_seconds()
+            )
+        )
+        self._away_since: dict[str, datetime] = {}
+        # Hosts left out by the options are dropped before indexing
+        self.host_filter = HostFilter.from_options(options)
+        # MACs of the hosts dropped by the filter in the last build
+        self.filtered_macs: set[str] = set()
+        # Consecutive failed refreshes, they open the breaker past a threshold
+        self.failures: int = 0
+        self.breaker_state: BreakerState = BreakerState.CLOSED
+        # Last fetched router info and the monotonic time it was fetched at,
+        # it is polled less often than hosts
+        self._router: Router | None = None
+        self._router_fetched_at: float | None = None
+        # Duration in seconds of the last call to each router endpoint
+        self.api_latency: dict[str, float] = {}
+        # Rolling timings and counters reported by diagnostics
+        self.perf = PerfStats()
+        # Records the router responses while a trace is running
+        self.trace: TraceRecorder | None = None
+        self._authenticated = False
+        # Serializes logins, the generation lets waiters skip a redundant one
+        self._auth_lock = asyncio.Lock()
+        self._auth_generation = 0
+        # Last good data, restored on startup before the router answers
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
+        self._snapshot_saved_at: float | None = None
+        # Staggers polls and caps requests across entries, merges presence
+        self.scheduler: BboxScheduler = async_get_scheduler(hass)
+        # WAN counters are polled on their own, faster cadence
+        self.wan = BboxWanCoordinator(hass, entry, self)
 
     @property
     def api(self) -> BboxApi:
@@ -69,8 +305,25 @@ class BboxDataUpdateCoordinator(DataUpdateCoordinator[BboxData]):
 
     async def _async_setup(self) -> None:
         """Set up the coordinator."""
+        if self._api is None:
+            # Take over a client already authenticated by a config flow or
+            # by this entry before a reload, along with its router info
+            registry = async_get_client_registry(self.hass)
+            if acquired := registry.async_acquire(self._base_url, self._password):
+                self._api, router = acquired
+                self._authenticated = True
+                if router is not None:
+                    self._set_router(router, time.monotonic())
+
+        if self._authenticated:
+            return
+
         try:
-            await self.api.authenticate()
+            await self._async_authenticate(self._auth_generation)
+        except BboxInvalidCredentialsError as err:
+            raise ConfigEntryAuthFailed(
+                "Invalid credentials, please re-authenticate"
+            ) from err
         except BboxTimeoutError as err:
             raise UpdateFailed(
                 f"Timeout connecting to Bbox at {self._base_url}"
@@ -78,30 +331,453 @@ class BboxDataUpdateCoordinator(DataUpdateCoordinator[BboxData]):
         except BboxApiError as err:
             raise UpdateFailed(f"Failed to connect to Bbox: {err}") from err
 
+    async def _async_authenticate(self, generation: int) -> None:
+        """Log in, unless another caller already did since `generation`."""
+        async with self._auth_lock:
+            if self._authenticated and generation != self._auth_generation:
+                return
+            await self.api.authenticate()
+            self._authenticated = True
+            self._auth_generation += 1
+            async_get_client_registry(self.hass).async_register(
+                self._base_url, self._password, self.api, in_use=True
+            )
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last persisted data, return whether there was any."""
+        if (stored := await self._store.async_load()) is None:
+            return False
+        try:
+            data = BboxData.from_dict(stored)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Discarding invalid Bbox snapshot: %s", err)
+            return False
+        if self.host_filter is not None:
+            # The filter may have changed since the snapshot was saved
+            hosts = self._filter_hosts(data.hosts_by_mac.values())
+            data = BboxData(data.router, hosts, data.now)
+        self.data = data
+        # Fall back on the restored router info until it is fetched again
+        self._set_router(data.router, None)
+        self._async_update_presence(data, None)
+        return True
+
+    def _save_snapshot(self, data: BboxData) -> None:
+        """Persist the data, at most once per SNAPSHOT_SAVE_INTERVAL."""
+        now = time.monotonic()
+        if (
+            self._snapshot_saved_at is not None
+            and now - self._snapshot_saved_at < SNAPSHOT_SAVE_INTERVAL.total_seconds()
+        ):
+            return
+        self._snapshot_saved_at = now
+        self._store.async_delay_save(data.as_dict)
+
+    def _filter_hosts(self, hosts: Iterable[_HostT]) -> list[_HostT]:
+        """Return the hosts kept by the host filter, remember the MACs dropped."""
+        assert self.host_filter is not None
+        kept: list[_HostT] = []
+        self.filtered_macs = set()
+        for host in hosts:
+            if self.host_filter.matches(host):
+                kept.append(host)
+            else:
+                self.filtered_macs.add(format_mac(host.macaddress))
+        return kept
+
+    async def _async_request(
+        self, endpoint: str, request: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Call an API endpoint, logging in again once if the session expired."""
+        generation = self._auth_generation
+        try:
+            return await self._async_timed(endpoint, request)
+        except (BboxSessionExpiredError, BboxUnauthenticatedError):
+            _LOGGER.debug("Bbox session expired, logging in again")
+            await self._async_authenticate(generation)
+            return await self._async_timed(endpoint, request)
+
+    async def _async_timed(
+        self, endpoint: str, request: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Call an API endpoint, record its latency and trace its response.
+
+        The latency does not include waiting for a free request slot.
+        """
+        async with self.scheduler.requests:
+            start = time.monotonic()
+            try:
+                result = await request()
+            except BboxApiError as err:
+                if self.trace is not None:
+                    self.trace.record_error(endpoint, err)
+                raise
+            finally:
+                self.api_latency[endpoint] = elapsed = time.monotonic() - start
+                self.perf.add_latency(endpoint, elapsed)
+                _LOGGER.debug("Fetched %s from Bbox in %.3fs", endpoint, elapsed)
+        if self.trace is not None:
+            self.trace.record(endpoint, result)
+        return result
+
+    async def async_get_wan_stats(self) -> WANIPStats:
+        """Fetch the WAN byte counters with the session used to poll hosts."""
+        if not self._authenticated:
+            await self._async_setup()
+        return await self._async_request("wan", self.api.get_wan_ip_stats)
+
     async def _async_update_data(self) -> BboxData:
-        """Fetch data from Bbox router."""
+        """Fetch data from Bbox router, backing off while it fails."""
         try:
-            # Fetch router info and connected hosts
-            router = await self.api.get_router_info()
-            hosts = await self.api.get_hosts()
+            data = await self._async_fetch_data()
+        except UpdateFailed as err:
+            self._record_failure(err)
+            raise
+        finally:
+            if self.trace is not None:
+                self.config_entry.async_create_background_task(
+                    self.hass, self.trace.async_flush(), f"{DOMAIN}_trace_flush"
+                )
 
-            return BboxData(router=router, hosts=hosts)
+        if self.failures:
+            _LOGGER.info("Bbox is reachable again, resuming normal polling")
+            self.failures = 0
+            self.breaker_state = BreakerState.CLOSED
+            self._async_breaker_updated()
+        # Poll in this entry's slot so that routers do not refresh together
+        self.update_interval = self.scheduler.next_interval(
+            self.config_entry.entry_id, self._interval
+        )
+        return data
 
-        except (BboxSessionExpiredError, BboxUnauthenticatedError) as err:
-            # Session expired, trigger re-authentication
-            _LOGGER.debug("Session expired, triggering re-authentication")
+    @callback
+    def _async_update_presence(self, data: BboxData, previous: BboxData | None) -> None:
+        """Share the hosts the router reports active with the other entries.
+
+        Hosts found by the first data of the entry only arrive once Home
+        Assistant is running, not while it starts.
+        """
+        arrived, departed = self.scheduler.async_update_presence(
+            self.config_entry.entry_id,
+            frozenset(mac for mac, host in data.hosts_by_mac.items() if host.active),
+        )
+        if previous is None and not self.hass.is_running:
+            return
+        self._async_fire_presence_changed(data, previous or data, arrived, departed)
+
+    @callback
+    def _async_fire_presence_changed(
+        self,
+        data: BboxData,
+        previous: BboxData,
+        arrived: list[str],
+        departed: list[str],
+    ) -> None:
+        """Fire the merged arrivals and departures, if any.
+
+        One event per refresh so automations subscribe once, not per host.
+        """
+        if not (arrived or departed):
+            return
+        self.hass.bus.async_fire(
+            EVENT_PRESENCE_CHANGED,
+            {
+                ATTR_CONFIG_ENTRY_ID: self.config_entry.entry_id,
+                **data.presence_event_data(previous, arrived, departed),
+            },
+        )
+
+    @callback
+    def _async_breaker_updated(self) -> None:
+        """Notify the breaker sensor of a change.
+
+        Coordinator listeners are not called again while refreshes keep failing.
+        """
+        async_dispatcher_send(
+            self.hass, SIGNAL_BREAKER_UPDATED.format(self.config_entry.entry_id)
+        )
+
+    def _record_failure(self, err: UpdateFailed) -> None:
+        """Schedule the next refresh after a failure.
+
+        Retries back off exponentially from the polling interval, with jitter so
+        that several routers do not retry in lockstep. Rate limiting starts the
+        backoff at RATE_LIMIT_BACKOFF. Past BREAKER_FAILURE_THRESHOLD failures the
+        breaker opens and only a probe is sent every BREAKER_PROBE_INTERVAL.
+        """
+        self.failures += 1
+        if self.failures >= BREAKER_FAILURE_THRESHOLD:
+            if self.breaker_state is not BreakerState.OPEN:
+                _LOGGER.warning(
+                    "Bbox failed %d times in a row, probing every %s: %s",
+                    self.failures,
+                    BREAKER_PROBE_INTERVAL,
+                    err,
+                )
+            self.breaker_state = BreakerState.OPEN
+            self.update_interval = max(BREAKER_PROBE_INTERVAL, self._interval)
+            self._async_breaker_updated()
+            return
+
+        base = self._interval
+        if isinstance(err.__cause__, BboxRateLimitError):
+            base = max(base, RATE_LIMIT_BACKOFF)
+        delay = base * 2 ** (self.failures - 1)
+        # Jitter only lengthens the delay, a failing router is never polled
+        # faster than a healthy one
+        delay *= random.uniform(1, 1 + BACKOFF_JITTER)
+        self.update_interval = min(delay, max(BREAKER_PROBE_INTERVAL, base))
+        _LOGGER.debug("Retrying Bbox in %s", self.update_interval)
+        self._async_breaker_updated()
+
+    async def _async_fetch_data(self) -> BboxData:
+        """Fetch router info and hosts."""
+        if not self._authenticated:
+            await self._async_setup()
+
+        try:
+            if self.breaker_state is not BreakerState.CLOSED:
+                # Probe with router info alone before polling hosts again
+                self.breaker_state = BreakerState.HALF_OPEN
+                self._set_router(
+                    await self._async_request("router", self.api.get_router_info),
+                    time.monotonic(),
+                )
+
+            router_result: Router | BaseException
+            hosts_result: list[Host] | BaseException
+            router_due = self._router_info_due()
+            if router_due:
+                # Fetch router info and connected hosts concurrently
+                router_result, hosts_result = await asyncio.gather(
+                    self._async_request("router", self.api.get_router_info),
+                    self._async_request("hosts", self.api.get_hosts),
+                    return_exceptions=True,
+                )
+            else:
+                assert self._router is not None
+                router_result = self._router
+                hosts_result = await self._async_request("hosts", self.api.get_hosts)
+
+            # Hosts drive presence, never fall back to stale ones
+            if isinstance(hosts_result, BaseException):
+                raise hosts_result
+
+            if isinstance(router_result, BaseException):
+                # Router info rarely changes, keep the last known one if possible
+                if (
+                    self._router is None
+                    or not isinstance(router_result, BboxApiError)
+                    or isinstance(
+                        router_result,
+                        (BboxSessionExpiredError, BboxUnauthenticatedError),
+                    )
+                ):
+                    raise router_result
+                _LOGGER.debug(
+                    "Failed to fetch router info, reusing previous one: %s",
+                    router_result,
+                )
+                router = self._router
+            else:
+                router = router_result
+                if router_due:
+                    self._set_router(router, time.monotonic())
+
+            # Advance the router clock by the time elapsed since it was sampled,
+            # a router restored from a snapshot was not sampled by this run
+            now = router.now
+            if self._router_fetched_at is not None:
+                now += timedelta(seconds=time.monotonic() - self._router_fetched_at)
+            start = time.perf_counter()
+            hosts: Iterable[Host] = hosts_result
+            if self.host_filter is not None:
+                hosts = self._filter_hosts(hosts)
+            data = BboxData.from_api(router, hosts, now)
+            if (previous := self.data) is not None:
+                if self._departure_grace:
+                    self._apply_departure_grace(data, previous)
+                data.diff(previous)
+            elapsed = time.perf_counter() - start
+            self.perf.build_time.add(elapsed)
+            _LOGGER.debug(
+                "%d of %d hosts changed, built and diffed in %.3fs",
+                len(data.changed_macs),
+                len(data.hosts_by_mac),
+                elapsed,
+            )
+            if previous is None or data.arrived or data.departed:
+                self._async_update_presence(data, previous)
+            self._adapt_update_interval(data)
+            self._save_snapshot(data)
+            return data
+
+        except BboxInvalidCredentialsError as err:
+            # Stored password was rejected, trigger re-authentication
+            _LOGGER.debug("Invalid credentials, triggering re-authentication")
             raise ConfigEntryAuthFailed(
-                "Session expired, please re-authenticate"
+                "Invalid credentials, please re-authenticate"
             ) from err
 
+        except (BboxSessionExpiredError, BboxUnauthenticatedError) as err:
+            raise UpdateFailed(f"Bbox session could not be restored: {err}") from err
+
+        except BboxRateLimitError as err:
+            raise UpdateFailed(f"Rate limited by Bbox: {err}") from err
+
         except BboxTimeoutError as err:
             raise UpdateFailed(f"Timeout fetching Bbox data: {err}") from err
 
         except BboxApiError as err:
             raise UpdateFailed(f"Error fetching Bbox data: {err}") from err
 
+    def _apply_departure_grace(self, data: BboxData, previous: BboxData) -> None:
+        """Keep hosts that left less than the departure grace period ago connected.
+
+        Phones in Wi-Fi power save drop off for a poll or two. A host reported
+        inactive stays connected until the router has not seen it for the grace
+        period. A host missing from the list stays until the grace period has
+        passed since the refresh it was last listed in.
+        """
+        away_since: dict[str, datetime] = {}
+        for mac, old in previous.hosts_by_mac.items():
+            if not old.active:
+                continue
+            host = data.hosts_by_mac.get(mac)
+            if host is not None and host.active:
+                continue
+            if host is not None and host.seen_at is not None:
+                since = host.seen_at
+            else:
+                since = self._away_since.get(mac, previous.now)
+            if data.now - since >= self._departure_grace:
+                continue
+            away_since[mac] = since
+            data.hosts_by_mac[mac] = (
+                old if host is None else dataclasses.replace(host, active=True)
+            )
+        self._away_since = away_since
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners of a refresh, timing their callbacks."""
+        self.perf.pending_writes = 0
+        start = time.perf_counter()
+        super().async_update_listeners()
+        elapsed = time.perf_counter() - start
+        _LOGGER.debug(
+            "Notified %d Bbox listeners in %.3fs, %d state writes",
+            len(self._listeners),
+            elapsed,
+            self.perf.pending_writes,
+        )
+        self.perf.add_refresh(len(self._listeners), elapsed)
+
+    def _set_router(self, router: Router, fetched_at: float | None) -> None:
+        """Keep router info with the monotonic time it was fetched at, if any."""
+        self._router = router
+        self._router_fetched_at = fetched_at
+
+    def _router_info_due(self) -> bool:
+        """Return whether router info should be fetched on this refresh."""
+        return (
+            self._router is None
+            or self._router_fetched_at is None
+            or time.monotonic() - self._router_fetched_at
+            >= ROUTER_INFO_SCAN_INTERVAL.total_seconds()
+        )
+
+    def _adapt_update_interval(self, data: BboxData) -> None:
+        """Poll faster while hosts come and go, back off when the network is quiet."""
+        if not self._adaptive:
+            return
+
+        if data.presence_changes:
+            interval = self._min_scan_interval
+        else:
+            interval = min(
+                self._interval * ADAPTIVE_BACKOFF_FACTOR,
+                self._max_scan_interval,
+            )
+
+        if interval != self._interval:
+            _LOGGER.debug("Adjusting Bbox polling interval to %s", interval)
+            self._interval = interval
+
+    async def async_start_trace(self, path: Path) -> None:
+        """Start recording the router responses to a trace file."""
+        await self.async_stop_trace()
+        self.trace = TraceRecorder(self.hass, path)
+
+    async def async_stop_trace(self) -> TraceRecorder | None:
+        """Stop recording, return the recorder once its trace is written."""
+        if (trace := self.trace) is None:
+            return None
+        self.trace = None
+        await trace.async_flush()
+        return trace
+
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        departed = self.scheduler.async_unregister(self.config_entry.entry_id)
+        if not self.hass.is_stopping:
+            # Hosts only this router reported leave the other routers' view
+            self._async_fire_presence_changed(self.data, self.data, [], departed)
+        await self.async_stop_trace()
+        await self.wan.async_shutdown()
         if self._api is not None:
-            await self._api.close()
+            # Keep the session around briefly so a reload can reuse it
+            async_get_client_registry(self.hass).async_release(
+                self._base_url, self._api
+            )
             self._api = None
+
+
+class BboxWanCoordinator(DataUpdateCoordinator[dict[str, ThroughputRates]]):
+    """Class to derive WAN throughput from the router byte counters."""
+
+    config_entry: ConfigEntry
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        router: BboxDataUpdateCoordinator,
+    ) -> None:
+        """Initialize the coordinator, fetching through the router coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_wan",
+            update_interval=WAN_STATS_SCAN_INTERVAL,
+        )
+        self.config_entry = entry
+        self._router = router
+        self._buffers = {
+            ATTR_BANDWIDTH_DOWN: CounterRingBuffer(THROUGHPUT_BUFFER_SIZE),
+            ATTR_BANDWIDTH_UP: CounterRingBuffer(THROUGHPUT_BUFFER_SIZE),
+        }
+
+    async def _async_update_data(self) -> dict[str, ThroughputRates]:
+        """Fetch the WAN byte counters and update the rates.
+
+        Polling pauses while the breaker is not closed, so that a failing router
+        is only sent the breaker probes.
+        """
+        if self._router.breaker_state is not BreakerState.CLOSED:
+            raise UpdateFailed("Bbox is failing, WAN stats are paused")
+        try:
+            stats = await self._router.async_get_wan_stats()
+        except BboxTimeoutError as err:
+            raise UpdateFailed(f"Timeout fetching Bbox WAN stats: {err}") from err
+        except BboxApiError as err:
+            raise UpdateFailed(f"Error fetching Bbox WAN stats: {err}") from err
+        counters = {
+            ATTR_BANDWIDTH_DOWN: stats.rx.bytes,
+            ATTR_BANDWIDTH_UP: stats.tx.bytes,
+        }
+
+        now = time.monotonic()
+        for key, counter in counters.items():
+            self._buffers[key].add(now, counter)
+        return {key: buffer.rates() for key, buffer in self._buffers.items()}
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
-from aiobbox.models import Host
 from homeassistant.components.device_tracker import ScannerEntity
 from homeassistant.components.device_tracker.const import SourceType
+from homeassistant.const import Platform
 from homeassistant.core import callback
-from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import (
     ATTR_CONNECTION_SPEED,
@@ -26,15 +29,17 @@ from .const import (
     ATTR_SIGNAL_STRENGTH,
     ATTR_WIRELESS_BAND,
     DOMAIN,
+    SIGNAL_PRESENCE_UPDATED,
 )
-from .entity import BboxEntity
+from .entity import BboxEntity, router_device_info
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import BboxDataUpdateCoordinator
+    from .coordinator import BboxData, BboxDataUpdateCoordinator
+    from .host import BboxHost
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,23 +52,159 @@ async def async_setup_entry(
     """Set up device tracker from a config entry."""
     coordinator: BboxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Create device tracker entities for all hosts
-    entities = [BboxDeviceTracker(coordinator, host) for host in coordinator.data.hosts]
+    if coordinator.filtered_macs:
+        _async_remove_filtered_trackers(hass, entry, coordinator.filtered_macs)
 
-    async_add_entities(entities)
+    known_macs: set[str] = set()
+    scheduler = coordinator.scheduler
+    device_registry = dr.async_get(hass)
+    # Host devices are attached to the router device, register it first
+    device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id, **router_device_info(coordinator)
+    )
+
+    @callback
+    def _async_add_new_hosts() -> None:
+        """Create device trackers for hosts not seen before, in one batch.
+
+        Hosts already tracked through another router are skipped, and retried
+        when they change.
+        """
+        data = coordinator.data
+        new_macs = [
+            mac
+            for mac in data.changed_macs - known_macs
+            if mac in data.hosts_by_mac
+            and scheduler.async_claim_tracker(entry.entry_id, mac)
+        ]
+        if not new_macs:
+            return
+        known_macs.update(new_macs)
+        # Trackers attach themselves to the device carrying their MAC
+        for mac in new_macs:
+            device_registry.async_get_or_create(
+                config_entry_id=entry.entry_id,
+                **_host_device_info(data.hosts_by_mac[mac], data.router.serialnumber),
+            )
+        async_add_entities(
+            BboxDeviceTracker(coordinator, data.hosts_by_mac[mac]) for mac in new_macs
+        )
+
+    # Create device tracker entities for current hosts, then for each new one
+    _async_add_new_hosts()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_hosts))
+
+
+@callback
+def _async_remove_filtered_trackers(
+    hass: HomeAssistant, entry: ConfigEntry, macs: set[str]
+) -> None:
+    """Remove the device trackers and devices of hosts left out by the filter."""
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        if entity.domain != Platform.DEVICE_TRACKER or entity.unique_id not in macs:
+            continue
+        _LOGGER.debug("Removing filtered out device tracker %s", entity.entity_id)
+        entity_registry.async_remove(entity.entity_id)
+        if entity.device_id is not None:
+            device_registry.async_update_device(
+                entity.device_id, remove_config_entry_id=entry.entry_id
+            )
+
+
+def _host_device_info(host: BboxHost, router_serial: str) -> DeviceInfo:
+    """Return the device info of a tracked host, connected through a router."""
+    device_info = DeviceInfo(
+        connections={(dr.CONNECTION_NETWORK_MAC, host.mac)},
+        name=host.hostname or host.macaddress,
+        via_device=(DOMAIN, router_serial),
+    )
+    if host.manufacturer:
+        device_info["manufacturer"] = host.manufacturer
+    if host.model:
+        device_info["model"] = host.model
+    return device_info
+
+
+def _signal_strength(rssi: int) -> int:
+    """Return the signal strength percentage of an RSSI, typically -100 to -30."""
+    if rssi <= -100:
+        return 0
+    if rssi >= -30:
+        return 100
+    return int(2 * (rssi + 100))
+
+
+def _host_attributes(host: BboxHost) -> dict[str, Any]:
+    """Return the state attributes of a host."""
+    attributes: dict[str, Any] = {
+        ATTR_CONNECTION_TYPE: host.type,
+        ATTR_LINK_TYPE: host.link,
+    }
+
+    if host.devicetype:
+        attributes[ATTR_DEVICE_TYPE] = host.devicetype
+
+    if host.firstseen:
+        attributes[ATTR_FIRST_SEEN] = host.firstseen
+
+    if host.last_seen is not None:
+        attributes[ATTR_LAST_SEEN] = host.last_seen
+
+    if host.guest is not None:
+        attributes[ATTR_GUEST] = host.guest
+
+    if host.lease:
+        attributes[ATTR_LEASE_TIME] = str(timedelta(seconds=host.lease))
+
+    if host.wireless:
+        if host.band:
+            attributes[ATTR_WIRELESS_BAND] = f"{host.band} GHz"
+        if host.rssi:
+            attributes[ATTR_RSSI] = f"{host.rssi} dBm"
+            attributes[ATTR_SIGNAL_STRENGTH] = f"{_signal_strength(host.rssi)} %"
+        if host.estimated_rate:
+            attributes[ATTR_CONNECTION_SPEED] = f"{host.estimated_rate} Mbps"
+
+    if host.ethernet_speed:
+        attributes[ATTR_CONNECTION_SPEED] = f"{host.ethernet_speed} Mbps"
+
+    if host.ipv6_addresses:
+        attributes[ATTR_IPV6_ADDRESSES] = list(host.ipv6_addresses)
+
+    return attributes
 
 
 class BboxDeviceTracker(BboxEntity, ScannerEntity):
     """Representation of a Bbox device tracker."""
 
-    _attr_has_entity_name = True
+    # Named after the host alone, its device carries the same name
+    _attr_has_entity_name = False
+    # Volatile attributes that would add a recorder row on nearly every poll
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_LAST_SEEN,
+            ATTR_LEASE_TIME,
+            ATTR_RSSI,
+            ATTR_SIGNAL_STRENGTH,
+            ATTR_CONNECTION_SPEED,
+        }
+    )
 
-    def __init__(self, coordinator: BboxDataUpdateCoordinator, host: Host) -> None:
+    def __init__(self, coordinator: BboxDataUpdateCoordinator, host: BboxHost) -> None:
         """Initialize the device tracker."""
         super().__init__(coordinator)
 
         self._host_mac: str = host.macaddress
-        self._attr_unique_id = format_mac(host.macaddress)
+        self._host_key: str = host.mac
+        self._attr_unique_id = self._host_key
+        # Last data and availability written to the state machine
+        self._last_data: BboxData = coordinator.data
+        self._last_available: bool = True
+        # State attributes and the host record they were built from
+        self._attributes: dict[str, Any] = {}
+        self._attributes_host: BboxHost | None = None
 
         # Set the name
         if host.hostname:
@@ -71,39 +212,33 @@ class BboxDeviceTracker(BboxEntity, ScannerEntity):
         else:
             self._attr_name = host.macaddress
 
-        # Device info for the tracked device
-        device_info = {
-            "identifiers": {(DOMAIN, self._host_mac)},
-            "name": self._attr_name,
-            "via_device": (DOMAIN, coordinator.data.router.serialnumber),
-        }
-
-        # Add device information if available
-        if host.informations:
-            if host.informations.type:
-                device_info["device_category"] = host.informations.type
-            if host.informations.manufacturer:
-                device_info["manufacturer"] = host.informations.manufacturer
-            if host.informations.model:
-                device_info["model"] = host.informations.model
-            if host.informations.operatingSystem:
-                device_info["operating_system"] = host.informations.operatingSystem
-
-        self._attr_device_info = device_info
-
     @property
-    def _host(self) -> Host | None:
+    def _host(self) -> BboxHost | None:
         """Return the host data."""
-        for host in self.coordinator.data.hosts:
-            if host.macaddress == self._host_mac:
-                return host
-        return None
+        return self.coordinator.data.hosts_by_mac.get(self._host_key)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to presence changes reported by the other routers."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_PRESENCE_UPDATED.format(self._host_key),
+                self._async_presence_updated,
+            )
+        )
+
+    @callback
+    def _async_presence_updated(self, entry_id: str) -> None:
+        """Write the state when another router changed the host presence."""
+        # Changes from this entry's router are written on coordinator update
+        if entry_id != self.coordinator.config_entry.entry_id:
+            self.async_write_ha_state()
 
     @property
     def is_connected(self) -> bool:
-        """Return true if the device is connected to the network."""
-        host = self._host
-        return host.active if host else False
+        """Return true if any router reports the device connected."""
+        return self.coordinator.scheduler.is_connected(self._host_key)
 
     @property
     def source_type(self) -> SourceType:
@@ -129,64 +264,32 @@ class BboxDeviceTracker(BboxEntity, ScannerEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+        """Return the state attributes, rebuilt only when the host changed."""
         host = self._host
         if not host:
             return {}
 
-        attributes: dict[str, Any] = {
-            ATTR_CONNECTION_TYPE: host.type,
-            ATTR_LINK_TYPE: host.link,
-        }
-
-        if host.devicetype:
-            attributes[ATTR_DEVICE_TYPE] = host.devicetype
-
-        if host.firstseen:
-            attributes[ATTR_FIRST_SEEN] = host.firstseen
-
-        if host.lastseen is not None:
-            attributes[ATTR_LAST_SEEN] = datetime.now() - timedelta(
-                seconds=host.lastseen
-            )
-
-        if host.guest is not None:
-            attributes[ATTR_GUEST] = host.guest
-
-        if host.lease:
-            attributes[ATTR_LEASE_TIME] = str(timedelta(seconds=host.lease))
-
-        if host.wireless:
-            if host.wireless.band:
-                attributes[ATTR_WIRELESS_BAND] = f"{host.wireless.band} GHz"
-            if host.wireless.rssi0:
-                attributes[ATTR_RSSI] = f"{host.wireless.rssi0} dBm"
-                # Calculate signal strength percentage (RSSI typically -100 to -30)
-                rssi = host.wireless.rssi0
-                if rssi <= -100:
-                    strength = 0
-                elif rssi >= -30:
-                    strength = 100
-                else:
-                    strength = int(2 * (rssi + 100))
-                attributes[ATTR_SIGNAL_STRENGTH] = f"{strength} %"
-            if host.wireless.estimatedRate:
-                attributes[ATTR_CONNECTION_SPEED] = (
-                    f"{host.wireless.estimatedRate} Mbps"
-                )
-
-        if host.ethernet and host.ethernet.speed:
-            attributes[ATTR_CONNECTION_SPEED] = f"{host.ethernet.speed} Mbps"
-
-        if host.ip6address:
-            ipv6_addrs = [addr.ipaddress for addr in host.ip6address]
-            attributes[ATTR_IPV6_ADDRESSES] = ipv6_addrs
-
-        return attributes
+        # Records are equal only when every field exposed in state is, including
+        # those that do not mark the host changed, so attributes are never stale
+        if host is not self._attributes_host:
+            if self._attributes_host is None or host != self._attributes_host:
+                self._attributes = _host_attributes(host)
+            self._attributes_host = host
+        return self._attributes
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        data = self.coordinator.data
+        available = self.available
+        # Skip the state write when neither this host nor availability changed
+        if available == self._last_available and (
+            data is self._last_data or self._host_key not in data.changed_macs
+        ):
+            return
+        self._last_data = data
+        self._last_available = available
+
         # Update the name if hostname changed
         host = self._host
         if host and host.hostname:
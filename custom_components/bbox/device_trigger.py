@@ -0,0 +1,109 @@
+"""Device triggers for Bbox integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_PLATFORM,
+    CONF_TYPE,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN, EVENT_PRESENCE_CHANGED, TRIGGER_TYPES
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+    from homeassistant.helpers.typing import ConfigType
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES)}
+)
+
+
+def _tracked_host(hass: HomeAssistant, device_id: str) -> str | None:
+    """Return the MAC of a tracked host device.
+
+    Host devices carry a MAC connection, routers only their serial number.
+    """
+    if (device := dr.async_get(hass).async_get(device_id)) is None:
+        return None
+    mac: str
+    for connection, mac in device.connections:
+        if connection == dr.CONNECTION_NETWORK_MAC:
+            return mac
+    return None
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """Return the triggers of a tracked host device."""
+    if _tracked_host(hass, device_id) is None:
+        return []
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+        }
+        for trigger_type in sorted(TRIGGER_TYPES)
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Fire the action when the host arrives or departs."""
+    device_id: str = config[CONF_DEVICE_ID]
+    trigger_type: str = config[CONF_TYPE]
+    if (mac := _tracked_host(hass, device_id)) is None:
+        raise vol.Invalid(f"Device {device_id} is not a Bbox tracked host")
+    job = HassJob(action)
+    trigger_data = trigger_info["trigger_data"]
+
+    @callback
+    def _matches(event_data: dict[str, Any]) -> bool:
+        """Return whether the presence event lists the host under this type.
+
+        Events hold arrivals and departures across all routers, so the host
+        may be reported by a router other than the one tracking it.
+        """
+        return any(host["mac"] == mac for host in event_data[trigger_type])
+
+    @callback
+    def _handle_event(event: Event) -> None:
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    CONF_PLATFORM: "device",
+                    CONF_DOMAIN: DOMAIN,
+                    CONF_DEVICE_ID: device_id,
+                    CONF_TYPE: trigger_type,
+                    "event": event,
+                    "description": f"Bbox host {trigger_type}",
+                }
+            },
+            event.context,
+        )
+
+    return hass.bus.async_listen(
+        EVENT_PRESENCE_CHANGED, _handle_event, event_filter=_matches
+    )
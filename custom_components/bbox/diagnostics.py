@@ -0,0 +1,40 @@
+"""Diagnostics support for Bbox integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_PASSWORD, CONF_UNIQUE_ID
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import BboxDataUpdateCoordinator
+
+TO_REDACT = {CONF_PASSWORD, CONF_UNIQUE_ID, "serialnumber"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: BboxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "router": async_redact_data(data.router.model_dump(mode="json"), TO_REDACT),
+        "hosts": len(data.hosts_by_mac),
+        "changed_hosts": len(data.changed_macs),
+        "update_interval": (
+            coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None
+        ),
+        "breaker_state": coordinator.breaker_state,
+        "consecutive_failures": coordinator.failures,
+        "performance": coordinator.perf.as_dict(),
+    }
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -9,23 +10,33 @@ from .const import CONF_BASE_URL, DOMAIN
 from .coordinator import BboxDataUpdateCoordinator
 
 
+def router_device_info(coordinator: BboxDataUpdateCoordinator) -> DeviceInfo:
+    """Return the device info of the router polled by a coordinator."""
+    router = coordinator.data.router
+    return DeviceInfo(
+        identifiers={(DOMAIN, router.serialnumber)},
+        name=router.modelname,
+        manufacturer="Bouygues Telecom",
+        model=router.modelclass,
+        serial_number=router.serialnumber,
+        sw_version=router.running.version,
+        configuration_url=coordinator.config_entry.data.get(CONF_BASE_URL),
+    )
+
+
 class BboxEntity(CoordinatorEntity[BboxDataUpdateCoordinator]):
     """Base entity for Bbox integration."""
 
     _attr_has_entity_name = True
+    coordinator: BboxDataUpdateCoordinator
 
     def __init__(self, coordinator: BboxDataUpdateCoordinator) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
+        self._attr_device_info = router_device_info(coordinator)
 
-        # Set up device info for the router
-        router = coordinator.data.router
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, router.serialnumber)},
-            name=router.modelname,
-            manufacturer="Bouygues Telecom",
-            model=router.modelclass,
-            serial_number=router.serialnumber,
-            sw_version=router.running.version,
-            configuration_url=coordinator.config_entry.data.get(CONF_BASE_URL),
-        )
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, counting writes for the refresh statistics."""
+        self.coordinator.perf.pending_writes += 1
+        super().async_write_ha_state()
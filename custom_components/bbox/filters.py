@@ -0,0 +1,119 @@
+"""Host filters for Bbox integration."""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.device_registry import format_mac
+
+from .const import (
+    CONF_DEVICE_TYPES,
+    CONF_EXCLUDE_HOSTNAMES,
+    CONF_EXCLUDE_MACS,
+    CONF_GUEST_FILTER,
+    CONF_INCLUDE_MACS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from aiobbox.models import Host
+
+    from .host import BboxHost
+
+
+class GuestFilter(StrEnum):
+    """Hosts kept by guest network membership."""
+
+    ALL = "all"
+    GUEST = "guest"
+    NON_GUEST = "non_guest"
+
+
+def is_mac_address(value: str) -> bool:
+    """Return whether a string is a MAC address, in any common format."""
+    mac = format_mac(value)
+    return len(mac) == 17 and mac.count(":") == 5
+
+
+class HostFilter:
+    """Select the hosts tracked by the integration.
+
+    A host is kept when it passes every configured filter: it is in the MAC
+    allow list if there is one, not in the deny list, its hostname matches no
+    excluded pattern, its guest status matches and its device type is listed if
+    any are.
+    """
+
+    __slots__ = (
+        "_device_types",
+        "_exclude_hostnames",
+        "_exclude_macs",
+        "_guest",
+        "_include_macs",
+    )
+
+    def __init__(
+        self,
+        *,
+        include_macs: Iterable[str] = (),
+        exclude_macs: Iterable[str] = (),
+        exclude_hostnames: Iterable[str] = (),
+        guest: GuestFilter = GuestFilter.ALL,
+        device_types: Iterable[str] = (),
+    ) -> None:
+        """Initialize the filter, hostname patterns are case-insensitive globs."""
+        self._include_macs = frozenset(format_mac(mac) for mac in include_macs)
+        self._exclude_macs = frozenset(format_mac(mac) for mac in exclude_macs)
+        # One expression for all patterns, matched once per host
+        patterns = [fnmatch.translate(pattern) for pattern in exclude_hostnames]
+        self._exclude_hostnames = (
+            re.compile("|".join(patterns), re.IGNORECASE) if patterns else None
+        )
+        self._guest = guest
+        self._device_types = frozenset(device_types)
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> HostFilter | None:
+        """Return the filter set in the entry options, or None if there is none."""
+        guest = GuestFilter(options.get(CONF_GUEST_FILTER, GuestFilter.ALL))
+        if guest is GuestFilter.ALL and not any(
+            options.get(key)
+            for key in (
+                CONF_INCLUDE_MACS,
+                CONF_EXCLUDE_MACS,
+                CONF_EXCLUDE_HOSTNAMES,
+                CONF_DEVICE_TYPES,
+            )
+        ):
+            return None
+        return cls(
+            include_macs=options.get(CONF_INCLUDE_MACS, ()),
+            exclude_macs=options.get(CONF_EXCLUDE_MACS, ()),
+            exclude_hostnames=options.get(CONF_EXCLUDE_HOSTNAMES, ()),
+            guest=guest,
+            device_types=options.get(CONF_DEVICE_TYPES, ()),
+        )
+
+    def matches(self, host: Host | BboxHost) -> bool:
+        """Return whether a host is tracked."""
+        if self._include_macs or self._exclude_macs:
+            mac = format_mac(host.macaddress)
+            if self._include_macs and mac not in self._include_macs:
+                return False
+            if mac in self._exclude_macs:
+                return False
+        if (
+            self._exclude_hostnames is not None
+            and host.hostname
+            and self._exclude_hostnames.match(host.hostname)
+        ):
+            return False
+        if self._guest is GuestFilter.GUEST and not host.guest:
+            return False
+        if self._guest is GuestFilter.NON_GUEST and host.guest:
+            return False
+        return not self._device_types or host.devicetype in self._device_types
@@ -0,0 +1,164 @@
+"""Compact host records for Bbox integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.device_registry import format_mac
+
+from .const import LAST_SEEN_RESOLUTION
+
+if TYPE_CHECKING:
+    from aiobbox.models import Host
+
+
+def floor_datetime(value: datetime, resolution: timedelta) -> datetime:
+    """Round a datetime down to a multiple of resolution."""
+    epoch = datetime.min.replace(tzinfo=value.tzinfo)
+    return value - (value - epoch) % resolution
+
+
+def host_seen_at(host: Host, now: datetime) -> datetime | None:
+    """Return when the router last saw the host, on the router clock."""
+    if host.lastseen is None:
+        return None
+    return now - timedelta(seconds=host.lastseen)
+
+
+def host_last_seen(host: Host, now: datetime) -> datetime | None:
+    """Return when the host was last seen, anchored to the router clock.
+
+    The router reports lastseen as seconds before its own clock, so the result
+    is rounded down to LAST_SEEN_RESOLUTION to stay stable between polls.
+    """
+    if (seen_at := host_seen_at(host, now)) is None:
+        return None
+    return floor_datetime(seen_at, LAST_SEEN_RESOLUTION)
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """Return a datetime as an ISO string, or None."""
+    return value.isoformat() if value is not None else None
+
+
+def _fromisoformat(value: str | None) -> datetime | None:
+    """Parse an ISO string, or return None."""
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+_DATETIME_FIELDS = ("firstseen", "last_seen", "seen_at")
+
+# Fields exposed in entity state, less the DHCP lease remaining, RSSI and
+# estimated rate that move on nearly every poll
+_FINGERPRINT = attrgetter(
+    "active",
+    "hostname",
+    "ipaddress",
+    "type",
+    "link",
+    "devicetype",
+    "firstseen",
+    "last_seen",
+    "guest",
+    "wireless",
+    "band",
+    "ethernet_speed",
+    "ipv6_addresses",
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BboxHost:
+    """Immutable record of the host fields used by the integration.
+
+    Two records compare equal when every field exposed in entity state is
+    equal. Usage counters and device details only read when entities are
+    created are left out of the comparison. The fingerprint also leaves out
+    the fields that move on nearly every poll, it tells whether a host
+    changed between refreshes.
+    """
+
+    mac: str
+    macaddress: str
+    active: bool
+    hostname: str | None = None
+    ipaddress: str | None = None
+    type: str | None = None
+    link: str | None = None
+    devicetype: str | None = None
+    firstseen: datetime | None = None
+    last_seen: datetime | None = None
+    guest: bool | None = None
+    lease: int | None = None
+    wireless: bool = False
+    band: float | None = None
+    rssi: int | None = None
+    estimated_rate: int | None = None
+    ethernet_speed: int | None = None
+    ipv6_addresses: tuple[str, ...] = ()
+    # Unrounded last_seen, used for the departure grace period
+    seen_at: datetime | None = field(default=None, compare=False)
+    tx_usage: int = field(default=0, compare=False)
+    rx_usage: int = field(default=0, compare=False)
+    device_category: str | None = field(default=None, compare=False)
+    manufacturer: str | None = field(default=None, compare=False)
+    model: str | None = field(default=None, compare=False)
+    operating_system: str | None = field(default=None, compare=False)
+
+    @classmethod
+    def from_host(cls, host: Host, now: datetime) -> BboxHost:
+        """Build a record from an aiobbox host, given the router clock."""
+        wireless = host.wireless
+        informations = host.informations
+        return cls(
+            mac=format_mac(host.macaddress),
+            macaddress=host.macaddress,
+            active=host.active,
+            hostname=host.hostname,
+            ipaddress=host.ipaddress,
+            type=host.type,
+            link=host.link,
+            devicetype=host.devicetype,
+            firstseen=host.firstseen,
+            last_seen=host_last_seen(host, now),
+            seen_at=host_seen_at(host, now),
+            guest=host.guest,
+            lease=host.lease,
+            wireless=wireless is not None,
+            band=wireless.band if wireless else None,
+            rssi=wireless.rssi0 if wireless else None,
+            estimated_rate=wireless.estimatedRate if wireless else None,
+            ethernet_speed=host.ethernet.speed if host.ethernet else None,
+            ipv6_addresses=tuple(addr.ipaddress for addr in host.ip6address or ()),
+            tx_usage=(wireless.txUsage or 0) if wireless else 0,
+            rx_usage=(wireless.rxUsage or 0) if wireless else 0,
+            device_category=informations.type if informations else None,
+            manufacturer=informations.manufacturer if informations else None,
+            model=informations.model if informations else None,
+            operating_system=informations.operatingSystem if informations else None,
+        )
+
+    @property
+    def fingerprint(self) -> tuple[Any, ...]:
+        """Return the fields whose change marks the host as changed."""
+        return _FINGERPRINT(self)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation of the record."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        for name in _DATETIME_FIELDS:
+            data[name] = _isoformat(data[name])
+        data["ipv6_addresses"] = list(self.ipv6_addresses)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BboxHost:
+        """Restore a record created by as_dict."""
+        data = dict(data)
+        for name in _DATETIME_FIELDS:
+            data[name] = _fromisoformat(data.get(name))
+        data["ipv6_addresses"] = tuple(data["ipv6_addresses"])
+        return cls(**data)
@@ -0,0 +1,114 @@
+"""Aggregate network occupancy for Bbox integration."""
+
+from __future__ import annotations
+
+import heapq
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from .const import WEAK_SIGNAL_RSSI, WIFI_BANDS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .host import BboxHost
+
+
+class BandOccupancy:
+    """Connected clients and their signal on one Wi-Fi band."""
+
+    __slots__ = ("_rssi_sum", "devices", "rssi_min", "rssi_samples")
+
+    def __init__(self) -> None:
+        """Initialize the band occupancy."""
+        self.devices = 0
+        self.rssi_samples = 0
+        self.rssi_min: int | None = None
+        self._rssi_sum = 0
+
+    def add(self, rssi: int | None) -> None:
+        """Count a client, with its RSSI if known."""
+        self.devices += 1
+        if not rssi:
+            return
+        self.rssi_samples += 1
+        self._rssi_sum += rssi
+        if self.rssi_min is None or rssi < self.rssi_min:
+            self.rssi_min = rssi
+
+    @property
+    def rssi_mean(self) -> float | None:
+        """Return the mean RSSI of the clients on the band."""
+        if not self.rssi_samples:
+            return None
+        return round(self._rssi_sum / self.rssi_samples, 1)
+
+
+class NetworkOccupancy:
+    """Connected device counts and Wi-Fi health over the whole host list."""
+
+    __slots__ = ("bands", "connected", "guest", "weak_signal", "wired", "wireless")
+
+    def __init__(self, hosts: Iterable[BboxHost]) -> None:
+        """Compute the occupancy in a single pass over the hosts."""
+        self.connected = 0
+        self.wired = 0
+        self.wireless = 0
+        self.guest = 0
+        self.weak_signal = 0
+        self.bands: dict[str, BandOccupancy] = {
+            band: BandOccupancy() for band in WIFI_BANDS.values()
+        }
+
+        for host in hosts:
+            if not host.active:
+                continue
+            self.connected += 1
+            if host.guest:
+                self.guest += 1
+
+            if not host.wireless and "wifi" not in (host.link or "").lower():
+                self.wired += 1
+                continue
+
+            self.wireless += 1
+            if not host.wireless:
+                continue
+            rssi = host.rssi
+            if rssi and rssi < WEAK_SIGNAL_RSSI:
+                self.weak_signal += 1
+            if host.band is not None and (band := WIFI_BANDS.get(host.band)):
+                self.bands[band].add(rssi)
+
+
+def host_usage(host: BboxHost) -> int:
+    """Return the combined Wi-Fi transmit and receive usage of a host."""
+    if not host.active:
+        return 0
+    return host.tx_usage + host.rx_usage
+
+
+def usage_entry(host: BboxHost) -> dict[str, Any]:
+    """Return the usage of a host as reported by the top talkers."""
+    return {
+        "mac": host.mac,
+        "name": host.hostname or host.macaddress,
+        "tx_usage": host.tx_usage,
+        "rx_usage": host.rx_usage,
+        "usage": host_usage(host),
+    }
+
+
+def top_talkers(
+    hosts: Iterable[BboxHost], count: int | None = None
+) -> list[dict[str, Any]]:
+    """Return hosts ranked by usage, keeping only the top count when given.
+
+    A bounded heap keeps the top count selection linear in the number of hosts.
+    """
+    talkers = ((usage, host) for host in hosts if (usage := host_usage(host)))
+    if count is None:
+        ranked = sorted(talkers, key=itemgetter(0), reverse=True)
+    else:
+        ranked = heapq.nlargest(count, talkers, key=itemgetter(0))
+    return [usage_entry(host) for _, host in ranked]
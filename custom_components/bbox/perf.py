@@ -0,0 +1,90 @@
+"""Per-poll performance instrumentation for Bbox integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from typing import Any
+
+from .const import PERF_HISTOGRAM_BUCKETS, PERF_WINDOW
+
+
+class RollingHistogram:
+    """Histogram and summary statistics over the last PERF_WINDOW samples."""
+
+    __slots__ = ("_buckets", "_samples")
+
+    def __init__(self, buckets: tuple[float, ...] | None = None) -> None:
+        """Initialize the histogram, summary statistics only without buckets."""
+        self._buckets = buckets
+        self._samples: deque[float] = deque(maxlen=PERF_WINDOW)
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self._samples.append(value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the bucket counts and summary statistics of the window."""
+        if not self._samples:
+            return {"count": 0}
+        ordered = sorted(self._samples)
+        result: dict[str, Any] = {
+            "count": len(ordered),
+            "mean": sum(ordered) / len(ordered),
+            "p50": ordered[len(ordered) // 2],
+            "p95": ordered[len(ordered) * 95 // 100],
+            "max": ordered[-1],
+        }
+        if self._buckets is not None:
+            counts = [0] * (len(self._buckets) + 1)
+            for value in ordered:
+                counts[bisect_left(self._buckets, value)] += 1
+            labels = [f"<={bound}" for bound in self._buckets]
+            labels.append(f">{self._buckets[-1]}")
+            result["buckets"] = dict(zip(labels, counts, strict=True))
+        return result
+
+
+class PerfStats:
+    """Rolling timings and counters of the coordinator refreshes.
+
+    Timings are in seconds. Listener and state write counts are taken while the
+    coordinator notifies its listeners of a refresh.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.api_latency: dict[str, RollingHistogram] = {}
+        self.build_time = RollingHistogram(PERF_HISTOGRAM_BUCKETS)
+        self.listeners_notified = RollingHistogram()
+        self.state_writes = RollingHistogram()
+        self.callback_time = RollingHistogram(PERF_HISTOGRAM_BUCKETS)
+        # State writes made while notifying the listeners of the current refresh
+        self.pending_writes = 0
+
+    def add_latency(self, endpoint: str, elapsed: float) -> None:
+        """Record the duration of an API call."""
+        if (histogram := self.api_latency.get(endpoint)) is None:
+            histogram = RollingHistogram(PERF_HISTOGRAM_BUCKETS)
+            self.api_latency[endpoint] = histogram
+        histogram.add(elapsed)
+
+    def add_refresh(self, listeners: int, elapsed: float) -> None:
+        """Record the listeners notified of a refresh and the state writes."""
+        self.listeners_notified.add(listeners)
+        self.state_writes.add(self.pending_writes)
+        self.callback_time.add(elapsed)
+        self.pending_writes = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "api_latency": {
+                endpoint: histogram.as_dict()
+                for endpoint, histogram in self.api_latency.items()
+            },
+            "build_time": self.build_time.as_dict(),
+            "listeners_notified": self.listeners_notified.as_dict(),
+            "state_writes": self.state_writes.as_dict(),
+            "callback_time": self.callback_time.as_dict(),
+        }
@@ -0,0 +1,123 @@
+"""Polling scheduler shared by the Bbox config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DATA_SCHEDULER, MAX_CONCURRENT_REQUESTS, SIGNAL_PRESENCE_UPDATED
+
+
+class BboxScheduler:
+    """Spread the polls of the config entries and merge their presence.
+
+    Routers polled on the same interval would otherwise refresh, and write the
+    state of their entities, at the same moment. Each entry polls at its own
+    even fraction of the interval, router requests are capped across entries,
+    and a host seen by several routers is connected while any reports it active.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        # Loaded entries, in the order of their polling slots
+        self._entries: list[str] = []
+        # Held around each router request
+        self.requests = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Active MACs reported by the last refresh of each entry
+        self._active: dict[str, frozenset[str]] = {}
+        # Entry whose device tracker stands for each MAC
+        self._trackers: dict[str, str] = {}
+
+    @callback
+    def async_register(self, entry_id: str) -> None:
+        """Give a loaded entry a polling slot."""
+        if entry_id not in self._entries:
+            self._entries.append(entry_id)
+
+    @callback
+    def async_unregister(self, entry_id: str) -> list[str]:
+        """Free the slot, device trackers and presence of an unloaded entry.
+
+        Return the MACs that departed with it while other entries stay loaded.
+        The scheduler is dropped with the last entry.
+        """
+        if entry_id in self._entries:
+            self._entries.remove(entry_id)
+        self._trackers = {
+            mac: owner for mac, owner in self._trackers.items() if owner != entry_id
+        }
+        _, departed = self.async_update_presence(entry_id, frozenset())
+        self._active.pop(entry_id, None)
+        if self._entries or self._active:
+            return departed
+        # Hosts are not tracked anymore rather than departed
+        if self._hass.data.get(DATA_SCHEDULER) is self:
+            del self._hass.data[DATA_SCHEDULER]
+        return []
+
+    def next_interval(self, entry_id: str, interval: timedelta) -> timedelta:
+        """Return the delay to the next polling slot of an entry.
+
+        Slots are spread evenly over the interval, the delay is between half and
+        one and a half intervals so that an entry settles into its slot.
+        """
+        if len(self._entries) < 2 or entry_id not in self._entries:
+            return interval
+        seconds = interval.total_seconds()
+        phase = seconds * self._entries.index(entry_id) / len(self._entries)
+        delay = (phase - self._hass.loop.time()) % seconds
+        if delay < seconds / 2:
+            delay += seconds
+        return timedelta(seconds=delay)
+
+    @callback
+    def async_claim_tracker(self, entry_id: str, mac: str) -> bool:
+        """Return whether an entry creates the device tracker of a MAC.
+
+        The first entry to see a MAC owns its tracker until it is unloaded.
+        """
+        return self._trackers.setdefault(mac, entry_id) == entry_id
+
+    def is_connected(self, mac: str) -> bool:
+        """Return whether any router reports the MAC active."""
+        return any(mac in active for active in self._active.values())
+
+    @callback
+    def async_update_presence(
+        self, entry_id: str, active: frozenset[str]
+    ) -> tuple[list[str], list[str]]:
+        """Record the active MACs of an entry, signal merged presence changes.
+
+        Return the MACs that arrived and departed across all routers. A host
+        roaming between routers neither departs nor arrives, nor does one found
+        by the first entry to report.
+        """
+        previous = self._active.get(entry_id)
+        self._active[entry_id] = active
+        others = [macs for other, macs in self._active.items() if other != entry_id]
+        if previous is None and not others:
+            return [], []
+        arrived: list[str] = []
+        departed: list[str] = []
+        for mac in sorted((previous or frozenset()) ^ active):
+            if any(mac in macs for macs in others):
+                continue
+            (arrived if mac in active else departed).append(mac)
+            if others:
+                async_dispatcher_send(
+                    self._hass, SIGNAL_PRESENCE_UPDATED.format(mac), entry_id
+                )
+        return arrived, departed
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> BboxScheduler:
+    """Return the scheduler, creating it if needed."""
+    scheduler: BboxScheduler | None = hass.data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_SCHEDULER] = BboxScheduler(hass)
+    return scheduler
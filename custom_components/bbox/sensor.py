@@ -0,0 +1,362 @@
+"""Sensor platform for Bbox integration."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from aiobbox.models import Router
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
+    UnitOfDataRate,
+)
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_BANDWIDTH_DOWN,
+    ATTR_BANDWIDTH_UP,
+    ATTR_FIRMWARE_VERSION,
+    ATTR_NUMBER_OF_BOOTS,
+    ATTR_TOP_TALKERS,
+    ATTR_UPTIME,
+    BOOT_TIME_RESOLUTION,
+    DOMAIN,
+    SIGNAL_BREAKER_UPDATED,
+    WIFI_BANDS,
+)
+from .coordinator import BboxWanCoordinator, BreakerState
+from .entity import BboxEntity
+from .host import floor_datetime
+from .occupancy import NetworkOccupancy
+from .throughput import ThroughputRates
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import BboxDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _boot_time(router: Router) -> datetime:
+    """Return when the router booted, stable across polls unlike the uptime."""
+    booted = dt_util.as_utc(router.now) - timedelta(seconds=router.uptime)
+    return floor_datetime(booted, BOOT_TIME_RESOLUTION)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BboxRouterSensorEntityDescription(SensorEntityDescription):
+    """Describes a Bbox router sensor."""
+
+    value_fn: Callable[[Router], StateType | datetime]
+
+
+ROUTER_SENSORS: tuple[BboxRouterSensorEntityDescription, ...] = (
+    BboxRouterSensorEntityDescription(
+        key=ATTR_UPTIME,
+        translation_key="last_boot",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_boot_time,
+    ),
+    BboxRouterSensorEntityDescription(
+        key=ATTR_NUMBER_OF_BOOTS,
+        translation_key=ATTR_NUMBER_OF_BOOTS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda router: router.numberofboots,
+    ),
+    BboxRouterSensorEntityDescription(
+        key=ATTR_FIRMWARE_VERSION,
+        translation_key=ATTR_FIRMWARE_VERSION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda router: router.running.version,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BboxOccupancySensorEntityDescription(SensorEntityDescription):
+    """Describes a Bbox network occupancy sensor."""
+
+    value_fn: Callable[[NetworkOccupancy], StateType]
+
+
+def _devices_sensor(
+    key: str, value_fn: Callable[[NetworkOccupancy], StateType]
+) -> BboxOccupancySensorEntityDescription:
+    """Return the description of a connected devices count sensor."""
+    return BboxOccupancySensorEntityDescription(
+        key=key,
+        translation_key=key,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=value_fn,
+    )
+
+
+def _rssi_sensor(
+    key: str, value_fn: Callable[[NetworkOccupancy], StateType]
+) -> BboxOccupancySensorEntityDescription:
+    """Return the description of a Wi-Fi signal strength sensor."""
+    return BboxOccupancySensorEntityDescription(
+        key=key,
+        translation_key=key,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=value_fn,
+    )
+
+
+OCCUPANCY_SENSORS: tuple[BboxOccupancySensorEntityDescription, ...] = (
+    _devices_sensor("connected_devices", lambda occupancy: occupancy.connected),
+    _devices_sensor("wired_devices", lambda occupancy: occupancy.wired),
+    _devices_sensor("wireless_devices", lambda occupancy: occupancy.wireless),
+    _devices_sensor("guest_devices", lambda occupancy: occupancy.guest),
+    _devices_sensor("weak_signal_devices", lambda occupancy: occupancy.weak_signal),
+    *(
+        description
+        for band in WIFI_BANDS.values()
+        for description in (
+            _devices_sensor(
+                f"wifi_{band}_devices",
+                lambda occupancy, band=band: occupancy.bands[band].devices,
+            ),
+            _rssi_sensor(
+                f"wifi_{band}_rssi_mean",
+                lambda occupancy, band=band: occupancy.bands[band].rssi_mean,
+            ),
+            _rssi_sensor(
+                f"wifi_{band}_rssi_min",
+                lambda occupancy, band=band: occupancy.bands[band].rssi_min,
+            ),
+        )
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BboxWanSensorEntityDescription(SensorEntityDescription):
+    """Describes a Bbox WAN throughput sensor."""
+
+    direction: str
+    value_fn: Callable[[ThroughputRates], float | None]
+
+
+def _wan_sensor(
+    key: str, direction: str, value_fn: Callable[[ThroughputRates], float | None]
+) -> BboxWanSensorEntityDescription:
+    """Return the description of a WAN throughput sensor."""
+    return BboxWanSensorEntityDescription(
+        key=key,
+        translation_key=key,
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        suggested_display_precision=2,
+        state_class=SensorStateClass.MEASUREMENT,
+        direction=direction,
+        value_fn=value_fn,
+    )
+
+
+WAN_SENSORS: tuple[BboxWanSensorEntityDescription, ...] = tuple(
+    description
+    for direction in (ATTR_BANDWIDTH_DOWN, ATTR_BANDWIDTH_UP)
+    for description in (
+        _wan_sensor(direction, direction, lambda rates: rates.current),
+        _wan_sensor(f"{direction}_average", direction, lambda rates: rates.average),
+        _wan_sensor(f"{direction}_peak", direction, lambda rates: rates.peak),
+    )
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up sensors from a config entry."""
+    coordinator: BboxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    entities: list[SensorEntity] = [
+        BboxRouterSensor(coordinator, description) for description in ROUTER_SENSORS
+    ]
+    entities.extend(
+        BboxOccupancySensor(coordinator, description)
+        for description in OCCUPANCY_SENSORS
+    )
+    entities.append(BboxTopTalkersSensor(coordinator))
+    entities.extend(
+        BboxWanSensor(
+            coordinator.wan, coordinator.data.router.serialnumber, description
+        )
+        for description in WAN_SENSORS
+    )
+    entities.append(BboxCircuitBreakerSensor(coordinator))
+
+    async_add_entities(entities)
+
+    # Rates need two counter samples, take the first one right away
+    entry.async_create_background_task(
+        hass, coordinator.wan.async_refresh(), f"{DOMAIN}_wan_first_refresh"
+    )
+
+
+class BboxRouterSensor(BboxEntity, SensorEntity):
+    """Router health sensor, read from the router info already polled."""
+
+    entity_description: BboxRouterSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BboxDataUpdateCoordinator,
+        description: BboxRouterSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{coordinator.data.router.serialnumber}_{description.key}"
+        )
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the sensor value."""
+        return self.entity_description.value_fn(self.coordinator.data.router)
+
+
+class BboxOccupancySensor(BboxEntity, SensorEntity):
+    """Aggregate network occupancy sensor, computed once per refresh."""
+
+    entity_description: BboxOccupancySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BboxDataUpdateCoordinator,
+        description: BboxOccupancySensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{coordinator.data.router.serialnumber}_{description.key}"
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the sensor value."""
+        return self.entity_description.value_fn(self.coordinator.data.occupancy)
+
+
+class BboxTopTalkersSensor(BboxEntity, SensorEntity):
+    """Host with the highest Wi-Fi usage, listing the top talkers."""
+
+    _attr_translation_key = "top_talker"
+    # The ranking changes on nearly every poll
+    _unrecorded_attributes = frozenset({ATTR_TOP_TALKERS})
+
+    def __init__(self, coordinator: BboxDataUpdateCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = (
+            f"{coordinator.data.router.serialnumber}_{self._attr_translation_key}"
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the name of the host with the highest usage."""
+        if not (talkers := self.coordinator.data.top_talkers):
+            return None
+        name: str = talkers[0]["name"]
+        return name
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the top talkers."""
+        return {ATTR_TOP_TALKERS: self.coordinator.data.top_talkers}
+
+
+class BboxWanSensor(CoordinatorEntity[BboxWanCoordinator], SensorEntity):
+    """WAN throughput sensor, derived from the router byte counters."""
+
+    _attr_has_entity_name = True
+    entity_description: BboxWanSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BboxWanCoordinator,
+        serial_number: str,
+        description: BboxWanSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{serial_number}_{description.key}"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, serial_number)})
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the sensor value."""
+        if self.coordinator.data is None:
+            return None
+        rates = self.coordinator.data[self.entity_description.direction]
+        return self.entity_description.value_fn(rates)
+
+
+class BboxCircuitBreakerSensor(BboxEntity, SensorEntity):
+    """State of the circuit breaker guarding the router polling."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_options = [state.value for state in BreakerState]
+    _attr_translation_key = "circuit_breaker"
+
+    def __init__(self, coordinator: BboxDataUpdateCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = (
+            f"{coordinator.data.router.serialnumber}_{self._attr_translation_key}"
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to breaker updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_BREAKER_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True, the breaker matters most while the router is failing."""
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """Return the state of the circuit breaker."""
+        return self.coordinator.breaker_state.value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return the number of consecutive failed refreshes."""
+        return {"consecutive_failures": self.coordinator.failures}
@@ -0,0 +1,101 @@
+"""Services for Bbox integration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    SERVICE_GET_USAGE_RANKING,
+    SERVICE_START_TRACE,
+    SERVICE_STOP_TRACE,
+)
+from .occupancy import top_talkers
+
+if TYPE_CHECKING:
+    from .coordinator import BboxDataUpdateCoordinator
+
+SERVICE_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+def _get_coordinator(
+    hass: HomeAssistant, call: ServiceCall
+) -> BboxDataUpdateCoordinator:
+    """Return the coordinator of the config entry targeted by a service call."""
+    entry_id: str = call.data[ATTR_CONFIG_ENTRY_ID]
+    coordinator: BboxDataUpdateCoordinator | None = hass.data.get(DOMAIN, {}).get(
+        entry_id
+    )
+    if coordinator is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    return coordinator
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Bbox services."""
+
+    async def async_get_usage_ranking(call: ServiceCall) -> ServiceResponse:
+        """Return all hosts ranked by Wi-Fi usage."""
+        coordinator = _get_coordinator(hass, call)
+        return {"hosts": top_talkers(coordinator.data.hosts_by_mac.values())}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_USAGE_RANKING,
+        async_get_usage_ranking,
+        schema=SERVICE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_start_trace(call: ServiceCall) -> None:
+        """Start recording the router responses to a trace file."""
+        coordinator = _get_coordinator(hass, call)
+        timestamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+        await coordinator.async_start_trace(
+            Path(
+                hass.config.path(
+                    f"{DOMAIN}_trace_{call.data[ATTR_CONFIG_ENTRY_ID]}_{timestamp}"
+                    ".jsonl.gz"
+                )
+            )
+        )
+
+    async def async_stop_trace(call: ServiceCall) -> ServiceResponse:
+        """Stop recording and return where the trace was written."""
+        coordinator = _get_coordinator(hass, call)
+        if (trace := await coordinator.async_stop_trace()) is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="trace_not_running",
+            )
+        return {"path": str(trace.path), "records": trace.records}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_TRACE, async_start_trace, schema=SERVICE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_TRACE,
+        async_stop_trace,
+        schema=SERVICE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
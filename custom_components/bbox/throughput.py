@@ -0,0 +1,72 @@
+"""Throughput derived from router byte counters for Bbox integration."""
+
+from __future__ import annotations
+
+from collections import deque
+
+COUNTER_32_BIT: int = 2**32
+# A 32-bit counter going backwards from above this value is assumed to wrap
+WRAP_THRESHOLD: int = COUNTER_32_BIT - COUNTER_32_BIT // 4
+
+
+class ThroughputRates:
+    """Current, average and peak rate in bytes per second."""
+
+    __slots__ = ("average", "current", "peak")
+
+    def __init__(
+        self, current: float | None, average: float | None, peak: float | None
+    ) -> None:
+        """Initialize the rates."""
+        self.current = current
+        self.average = average
+        self.peak = peak
+
+
+class CounterRingBuffer:
+    """Fixed-size ring buffer of rates computed from a monotonic byte counter.
+
+    Each sample is turned into the byte delta and duration since the previous
+    one. A counter going backwards from near the top of the 32-bit range has
+    wrapped and is corrected, otherwise the router rebooted and the interval is
+    dropped since the bytes transferred before the reset are unknown.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the buffer."""
+        self._intervals: deque[tuple[float, int]] = deque(maxlen=size)
+        self._last: tuple[float, int] | None = None
+
+    def add(self, timestamp: float, counter: int) -> None:
+        """Add a counter sample taken at a monotonic timestamp."""
+        last, self._last = self._last, (timestamp, counter)
+        if last is None:
+            return
+
+        last_timestamp, last_counter = last
+        duration = timestamp - last_timestamp
+        if duration <= 0:
+            return
+
+        delta = counter - last_counter
+        if delta < 0:
+            if WRAP_THRESHOLD <= last_counter < COUNTER_32_BIT:
+                delta += COUNTER_32_BIT
+            else:
+                # Counter reset by a reboot
+                return
+        self._intervals.append((duration, delta))
+
+    def rates(self) -> ThroughputRates:
+        """Return the current, time-weighted average and peak rates."""
+        if not self._intervals:
+            return ThroughputRates(None, None, None)
+
+        duration, delta = self._intervals[-1]
+        total_duration = sum(duration for duration, _ in self._intervals)
+        total_bytes = sum(delta for _, delta in self._intervals)
+        return ThroughputRates(
+            current=delta / duration,
+            average=total_bytes / total_duration,
+            peak=max(delta / duration for duration, delta in self._intervals),
+        )
@@ -0,0 +1,90 @@
+"""Record router responses to a trace file for Bbox integration."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from .const import TRACE_REDACT
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+REDACTED = "**REDACTED**"
+
+
+def _redact(data: Any) -> Any:
+    """Replace the TRACE_REDACT fields of nested dicts and lists."""
+    if isinstance(data, dict):
+        return {
+            key: REDACTED if key.lower() in TRACE_REDACT else _redact(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [_redact(item) for item in data]
+    return data
+
+
+def _dump(result: Any) -> Any:
+    """Return a compact, redacted JSON serializable form of an API response."""
+    if isinstance(result, BaseModel):
+        return _redact(result.model_dump(mode="json", exclude_none=True))
+    if isinstance(result, list):
+        return [_dump(item) for item in result]
+    return result
+
+
+class TraceRecorder:
+    """Record the responses of the router, one JSON line each, gzipped.
+
+    Each line holds the monotonic offset since recording started, the endpoint
+    and either the response or the exception raised. Only parsed responses are
+    recorded, so the password and session cookie never reach the trace.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        """Initialize the recorder."""
+        self._hass = hass
+        self.path = path
+        self.records = 0
+        self._start = time.monotonic()
+        self._lines: list[str] = []
+        self._lock = asyncio.Lock()
+
+    def record(self, endpoint: str, result: Any) -> None:
+        """Record a response."""
+        self._append({"e": endpoint, "d": _dump(result)})
+
+    def record_error(self, endpoint: str, err: Exception) -> None:
+        """Record an exception raised instead of a response."""
+        self._append({"e": endpoint, "x": type(err).__name__, "m": str(err)})
+
+    def _append(self, record: dict[str, Any]) -> None:
+        """Buffer a record until the next flush."""
+        record["t"] = round(time.monotonic() - self._start, 3)
+        self._lines.append(json.dumps(record, separators=(",", ":")))
+        self.records += 1
+
+    async def async_flush(self) -> None:
+        """Append the buffered records to the trace file."""
+        async with self._lock:
+            lines, self._lines = self._lines, []
+            if lines:
+                await self._hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines to the trace file, each flush adds a gzip member."""
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            file.writelines(f"{line}\n" for line in lines)
+
+
+def read_trace(path: Path) -> list[dict[str, Any]]:
+    """Return the records of a trace file, in the order they were recorded."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
@@ -1,5 +1,9 @@
 """Tests for the Bbox integration."""
 
+from datetime import datetime
+from typing import Any
+
+from aiobbox.models import Host, WANIPStats, WirelessInfo
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -10,3 +14,78 @@ async def setup_integration(hass: HomeAssistant, config_entry: MockConfigEntry)
 
     assert await hass.config_entries.async_setup(config_entry.entry_id)
     await hass.async_block_till_done()
+
+
+def make_host(index: int, *, active: bool = True) -> Host:
+    """Build a synthetic host with a unique MAC address derived from index."""
+    mac = ":".join(f"{(index >> shift) & 0xFF:02X}" for shift in (40, 32, 24, 16, 8, 0))
+    return Host(
+        id=index,
+        active=active,
+        hostname=f"host-{index}",
+        ipaddress=f"192.168.{(index >> 8) & 0xFF}.{index & 0xFF}",
+        macaddress=mac,
+        type="DHCP",
+        link="Wifi 5",
+        lease=3600,
+        firstseen=datetime(2025, 1, 1),
+        lastseen=0,
+        devicetype="Computer",
+    )
+
+
+def make_hosts(count: int, *, changed_every: int = 0) -> list[Host]:
+    """Build a synthetic host list mixing wireless, wired and inactive hosts.
+
+    With changed_every, every changed_every-th host gets a new IP address, as
+    when comparing a refresh with the previous one.
+    """
+    hosts = []
+    for index in range(count):
+        host = make_host(index, active=index % 5 != 4)
+        update: dict[str, Any] = {}
+        if index % 3:
+            update["wireless"] = WirelessInfo(
+                wexindex=1,
+                static=False,
+                band=(2.4, 5.0, 6.0)[index % 3],
+                txUsage=index,
+                rxUsage=2 * index,
+                estimatedRate=866,
+                rssi0=-40 - index % 50,
+                mcs=9,
+                rate=866,
+            )
+        else:
+            update["link"] = "Ethernet"
+        if changed_every and not index % changed_every:
+            update["ipaddress"] = f"10.0.{(index >> 8) & 0xFF}.{index & 0xFF}"
+        hosts.append(host.model_copy(update=update))
+    return hosts
+
+
+def _wan_stats_counters(byte_count: int) -> dict[str, Any]:
+    """Return the counters of one WAN direction."""
+    return {
+        "bytes": byte_count,
+        "packets": 0,
+        "packetserrors": 0,
+        "packetsdiscards": 0,
+        "occupation": 0,
+        "bandwidth": 0,
+        "maxBandwidth": 0,
+        "contractualBandwidth": 0,
+    }
+
+
+def wan_stats_payload(rx_bytes: int, tx_bytes: int) -> list[dict[str, Any]]:
+    """Return a WAN stats response with the given byte counters."""
+    stats = {"rx": _wan_stats_counters(rx_bytes), "tx": _wan_stats_counters(tx_bytes)}
+    return [{"wan": {"ip": {"stats": stats}}}]
+
+
+def wan_stats(rx_bytes: int, tx_bytes: int) -> WANIPStats:
+    """Return WAN stats as parsed by BboxApi, with the given byte counters."""
+    return WANIPStats.model_validate(
+        wan_stats_payload(rx_bytes, tx_bytes)[0]["wan"]["ip"]["stats"]
+    )
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
 from aiobbox.models import (
     DeviceInformation,
@@ -17,11 +18,23 @@ from aiobbox.models import (
     WirelessInfo,
 )
 from homeassistant.const import CONF_PASSWORD
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 from pytest_homeassistant_custom_component.syrupy import HomeAssistantSnapshotExtension
 from syrupy.assertion import SnapshotAssertion
 
-from custom_components.bbox.const import CONF_BASE_URL, DOMAIN
+from custom_components.bbox.const import (
+    CLIENT_RELEASE_DELAY,
+    CONF_BASE_URL,
+    DOMAIN,
+)
+
+from . import wan_stats
+from .fake_bbox import FakeBbox
 
 pytest_plugins = "pytest_homeassistant_custom_component"
 
@@ -181,9 +194,62 @@ def mock_bbox_api(
         api_instance.get_hosts = AsyncMock(
             return_value=[mock_host_active, mock_host_inactive]
         )
+        api_instance.get_wan_ip_stats = AsyncMock(
+            return_value=wan_stats(1_000_000, 500_000)
+        )
         api_instance.close = AsyncMock()
 
         # Configure config_flow mock to match coordinator mock
         mock_api_config_flow.return_value = api_instance
 
         yield api_instance
+
+
+@pytest.fixture
+async def fake_bbox(
+    hass: HomeAssistant,
+    mock_router: Router,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+) -> AsyncGenerator[FakeBbox]:
+    """Serve a fake router over real HTTP, used instead of mock_bbox_api."""
+    bbox = FakeBbox(
+        mock_router, [mock_host_active, mock_host_inactive], "test_password"
+    )
+    await bbox.start()
+    # The router is addressed by IP, which the default cookie jar ignores
+    session = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar(unsafe=True))
+    with (
+        patch(
+            "custom_components.bbox.coordinator.async_get_clientsession",
+            return_value=session,
+        ),
+        patch(
+            "custom_components.bbox.config_flow.async_get_clientsession",
+            return_value=session,
+        ),
+    ):
+        yield bbox
+
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            await hass.config_entries.async_unload(entry.entry_id)
+        # Let the client registry close the released clients
+        async_fire_time_changed(hass, dt_util.utcnow() + CLIENT_RELEASE_DELAY)
+        await hass.async_block_till_done()
+
+    await session.close()
+    await bbox.close()
+
+
+@pytest.fixture
+def fake_bbox_config_entry(fake_bbox: FakeBbox) -> MockConfigEntry:
+    """Create a config entry pointing at the fake router."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Bbox Test Router",
+        data={
+            CONF_BASE_URL: fake_bbox.base_url,
+            CONF_PASSWORD: fake_bbox.password,
+        },
+        unique_id="TEST12345",
+    )
@@ -0,0 +1,183 @@
+"""In-process fake Bbox router serving the /api/v1 endpoints used by the integration.
+
+The fake speaks HTTP like the router does: a form login sets a BBOX_ID session
+cookie, and the device, hosts and WAN stats endpoints return the router's JSON
+payloads. Latency, jitter, session expiry, login rate limiting and server
+errors can be injected to exercise the integration under load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import secrets
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from . import wan_stats_payload
+
+if TYPE_CHECKING:
+    from aiobbox.models import Host, Router
+
+API_PREFIX = "/api/v1"
+SESSION_COOKIE = "BBOX_ID"
+
+_Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class FakeBbox:
+    """Emulate a Bbox router, with configurable faults."""
+
+    def __init__(
+        self,
+        router: Router,
+        hosts: list[Host],
+        password: str,
+        *,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the fake router."""
+        self.router = router
+        self.hosts = hosts
+        self.password = password
+        # Delay of every response, with a uniformly distributed jitter on top
+        self.latency = 0.0
+        self.jitter = 0.0
+        # Share of requests answered with a server error
+        self.error_rate = 0.0
+        # Sessions expire this many seconds after login
+        self.session_lifetime: float | None = None
+        # At most this many logins per rate_limit_window seconds
+        self.login_rate_limit: int | None = None
+        self.rate_limit_window = 60.0
+        self.rx_bytes = 0
+        self.tx_bytes = 0
+        # Requests received and errors returned, by endpoint
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._sessions: dict[str, float] = {}
+        self._logins: list[float] = []
+        self._server: TestServer | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Return the API base URL of the running server."""
+        assert self._server is not None
+        return str(self._server.make_url(f"{API_PREFIX}/"))
+
+    @property
+    def logins(self) -> int:
+        """Return the number of successful logins."""
+        return self.requests["login"] - self.errors["login"]
+
+    async def start(self) -> None:
+        """Start serving on a free localhost port."""
+        self._server = TestServer(self._app(), host="127.0.0.1")
+        await self._server.start_server()
+
+    async def close(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    def expire_sessions(self) -> None:
+        """Invalidate every session, as a router reboot does."""
+        self._sessions.clear()
+
+    def _app(self) -> web.Application:
+        """Return the web application serving the API."""
+        app = web.Application(middlewares=[self._fault_middleware])
+        app.router.add_post(f"{API_PREFIX}/login", self._login)
+        app.router.add_get(f"{API_PREFIX}/device", self._device)
+        app.router.add_get(f"{API_PREFIX}/hosts", self._hosts)
+        app.router.add_get(f"{API_PREFIX}/wan/ip/stats", self._wan_stats)
+        return app
+
+    @web.middleware
+    async def _fault_middleware(
+        self, request: web.Request, handler: _Handler
+    ) -> web.StreamResponse:
+        """Delay responses and inject server errors."""
+        endpoint = request.path.removeprefix(f"{API_PREFIX}/")
+        self.requests[endpoint] += 1
+        if delay := self.latency + self._random.uniform(0, self.jitter):
+            await asyncio.sleep(delay)
+        if self._random.random() < self.error_rate:
+            self.errors[endpoint] += 1
+            return _error(500, "Internal error")
+        response = await handler(request)
+        if response.status >= 400:
+            self.errors[endpoint] += 1
+        return response
+
+    async def _login(self, request: web.Request) -> web.StreamResponse:
+        """Open a session if the password matches."""
+        now = time.monotonic()
+        if self.login_rate_limit is not None:
+            self._logins = [
+                login for login in self._logins if now - login < self.rate_limit_window
+            ]
+            if len(self._logins) >= self.login_rate_limit:
+                return _error(429, "Too many login attempts")
+            self._logins.append(now)
+
+        form = await request.post()
+        if form.get("password") != self.password:
+            return _error(401, "Invalid password")
+
+        token = secrets.token_hex(16)
+        self._sessions[token] = now
+        response = web.Response(status=200)
+        response.set_cookie(SESSION_COOKIE, token, path="/")
+        return response
+
+    def _authenticated(self, request: web.Request) -> bool:
+        """Return whether the request carries a live session."""
+        token = request.cookies.get(SESSION_COOKIE)
+        if token is None or (opened := self._sessions.get(token)) is None:
+            return False
+        if (
+            self.session_lifetime is not None
+            and time.monotonic() - opened >= self.session_lifetime
+        ):
+            del self._sessions[token]
+            return False
+        return True
+
+    async def _device(self, request: web.Request) -> web.StreamResponse:
+        """Return the router info."""
+        if not self._authenticated(request):
+            return _error(401, "Unauthorized")
+        return web.json_response([{"device": self.router.model_dump(mode="json")}])
+
+    async def _hosts(self, request: web.Request) -> web.StreamResponse:
+        """Return the hosts."""
+        if not self._authenticated(request):
+            return _error(401, "Unauthorized")
+        hosts = [host.model_dump(mode="json") for host in self.hosts]
+        return web.json_response([{"hosts": {"list": hosts}}])
+
+    async def _wan_stats(self, request: web.Request) -> web.StreamResponse:
+        """Return the WAN byte counters."""
+        if not self._authenticated(request):
+            return _error(401, "Unauthorized")
+        return web.json_response(wan_stats_payload(self.rx_bytes, self.tx_bytes))
+
+
+def _error(status: int, reason: str) -> web.Response:
+    """Return an API error response, shaped like the router's."""
+    body: dict[str, Any] = {
+        "exception": {
+            "code": status,
+            "domain": "",
+            "errors": [{"name": "", "reason": reason}],
+        }
+    }
+    return web.json_response(body, status=status, reason=reason)
@@ -0,0 +1,155 @@
+"""Replay a recorded Bbox trace through the integration faster than real time.
+
+The recorded responses are served in order by a stand-in for BboxApi, while the
+coordinator's monotonic clock follows the offsets of the trace. Refreshes run
+back to back, so a day of polling replays in seconds with the same router
+clock, polling schedules and state transitions as when it was recorded.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+from aiobbox import exceptions
+from aiobbox.models import Host, Router, WANIPStats
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+
+from custom_components.bbox.const import DOMAIN
+from custom_components.bbox.trace import read_trace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+# Responses to one refresh are all recorded within this many seconds
+REFRESH_SPAN = 1.0
+
+
+class VirtualClock:
+    """Monotonic clock set to the offsets of the replayed trace."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        """Return the current offset."""
+        return self.now
+
+
+def _error(record: dict[str, Any]) -> Exception:
+    """Rebuild the exception recorded in a trace."""
+    cls = getattr(exceptions, record["x"], exceptions.BboxApiError)
+    try:
+        error: Exception = cls(record["m"])
+    except TypeError:
+        error = exceptions.BboxApiError(record["m"])
+    return error
+
+
+class ReplayApi:
+    """Serve the responses of a trace in place of BboxApi."""
+
+    def __init__(self, records: list[dict[str, Any]], clock: VirtualClock) -> None:
+        """Initialize the API from the trace records."""
+        self._clock = clock
+        self._queues: dict[str, deque[dict[str, Any]]] = {}
+        for record in records:
+            self._queues.setdefault(record["e"], deque()).append(record)
+        self._router: dict[str, Any] | None = None
+
+    def next_offset(self, endpoint: str) -> float | None:
+        """Return the offset of the next response for an endpoint."""
+        queue = self._queues.get(endpoint)
+        return queue[0]["t"] if queue else None
+
+    async def authenticate(self) -> None:
+        """Log in, which a replay does not need."""
+
+    async def close(self) -> None:
+        """Close the API."""
+
+    async def get_router_info(self) -> Router:
+        """Return the latest router info recorded by now."""
+        queue = self._queues.get("router", deque())
+        record = self._router
+        while queue and (
+            record is None or queue[0]["t"] <= self._clock.now + REFRESH_SPAN
+        ):
+            record = queue.popleft()
+            if "x" in record:
+                raise _error(record)
+            self._router = record
+        if record is None:
+            raise exceptions.BboxApiError("No router info in trace")
+        return Router.model_validate(record["d"])
+
+    async def get_hosts(self) -> list[Host]:
+        """Return the next recorded hosts."""
+        record = self._queues["hosts"].popleft()
+        if "x" in record:
+            raise _error(record)
+        return [Host.model_validate(host) for host in record["d"]]
+
+    async def get_wan_ip_stats(self) -> WANIPStats:
+        """Return the next recorded WAN stats."""
+        queue = self._queues.get("wan")
+        if not queue:
+            raise exceptions.BboxApiError("No WAN stats in trace")
+        record = queue.popleft()
+        if "x" in record:
+            raise _error(record)
+        return WANIPStats.model_validate(record["d"])
+
+
+async def async_replay(
+    hass: HomeAssistant, config_entry: MockConfigEntry, path: Path
+) -> list[tuple[float, str, str | None, str | None]]:
+    """Replay a trace, return the device tracker state transitions.
+
+    Each transition is the trace offset, the entity ID and the old and new
+    states.
+    """
+    clock = VirtualClock()
+    api = ReplayApi(read_trace(path), clock)
+    transitions: list[tuple[float, str, str | None, str | None]] = []
+
+    @callback
+    def _record_transition(event: Event[EventStateChangedData]) -> None:
+        entity_id = event.data["entity_id"]
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        old = old_state.state if old_state else None
+        new = new_state.state if new_state else None
+        if entity_id.startswith("device_tracker.") and old != new:
+            transitions.append((clock.now, entity_id, old, new))
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _record_transition)
+    with (
+        patch("custom_components.bbox.coordinator.BboxApi", return_value=api),
+        patch(
+            "custom_components.bbox.coordinator.time",
+            SimpleNamespace(monotonic=clock.monotonic, perf_counter=time.perf_counter),
+        ),
+    ):
+        clock.now = api.next_offset("hosts") or 0.0
+        config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+        while (offset := api.next_offset("hosts")) is not None:
+            clock.now = offset
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+
+        # Stop recording first, unloading makes the trackers unavailable
+        unsub()
+        await hass.config_entries.async_unload(config_entry.entry_id)
+    return transitions
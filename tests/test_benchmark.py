@@ -0,0 +1,241 @@
+"""Benchmarks for the Bbox integration hot paths.
+
+The scale benchmarks are marked `benchmark` and deselected by default, run them
+with `pytest -m benchmark`. Setting BBOX_BENCHMARK_OUTPUT to a file path writes
+the timings as JSON, so runs on two commits can be compared.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import defaultdict
+from collections.abc import Generator
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from aiobbox.models import Router
+from homeassistant.const import EVENT_STATE_CHANGED, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.entity_platform import async_get_platforms
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bbox.const import DOMAIN
+from custom_components.bbox.coordinator import BboxData
+
+from . import make_host, make_hosts, setup_integration
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from custom_components.bbox.device_tracker import BboxDeviceTracker
+
+SIZES = (100, 400, 1600)
+REPEATS = 5
+BENCHMARK_SIZES = (10, 100, 1000, 5000)
+# Share of hosts changing between two refreshes in the scale benchmarks
+CHANGED_EVERY = 10
+# Properties read per entity on each refresh (is_connected, ip_address, ...)
+READS_PER_ENTITY = 5
+
+
+def _refresh_cost(mock_router: Router, size: int) -> float:
+    """Return the best time to build BboxData and resolve every entity's host."""
+    hosts = [make_host(index) for index in range(size)]
+    keys = [format_mac(host.macaddress) for host in hosts]
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        data = BboxData.from_api(mock_router, hosts)
+        for key in keys:
+            for _ in range(READS_PER_ENTITY):
+                assert data.hosts_by_mac.get(key) is not None
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_hosts_indexed_by_mac(mock_router: Router) -> None:
+    """Test hosts are indexed in a dict keyed by formatted MAC address."""
+    hosts = [make_host(index) for index in range(SIZES[0])]
+    data = BboxData.from_api(mock_router, hosts)
+
+    assert isinstance(data.hosts_by_mac, dict)
+    assert list(data.hosts_by_mac) == [format_mac(host.macaddress) for host in hosts]
+
+
+@pytest.mark.benchmark
+def test_refresh_cost_grows_linearly(mock_router: Router) -> None:
+    """Test per-host refresh cost stays flat as the host count grows."""
+    costs = {size: _refresh_cost(mock_router, size) / size for size in SIZES}
+
+    # A linear scan per lookup would grow the per-host cost 16x here.
+    assert costs[SIZES[-1]] < costs[SIZES[0]] * 4
+
+
+def test_get_host_normalizes_mac(mock_router: Router) -> None:
+    """Test host lookup is independent of MAC address formatting."""
+    host = make_host(42)
+    data = BboxData.from_api(mock_router, [host])
+
+    record = data.get_host(host.macaddress.lower())
+    assert record is not None
+    assert record.macaddress == host.macaddress
+    assert data.get_host(host.macaddress.replace(":", "-")) is record
+    assert data.get_host("00:00:00:00:00:00") is None
+
+
+@pytest.fixture(scope="module")
+def benchmark_results() -> Generator[dict[str, dict[int, dict[str, float]]]]:
+    """Collect scale benchmark results, written out as JSON if requested."""
+    results: dict[str, dict[int, dict[str, float]]] = defaultdict(dict)
+    yield results
+    if results and (output := os.environ.get("BBOX_BENCHMARK_OUTPUT")):
+        Path(output).write_text(json.dumps(results, indent=2, sort_keys=True))
+
+
+def _record(
+    results: dict[str, dict[int, dict[str, float]]],
+    name: str,
+    size: int,
+    seconds: float,
+    **extra: float,
+) -> None:
+    """Record a benchmark timing along with its cost per host."""
+    results[name][size] = {
+        "seconds": seconds,
+        "us_per_host": seconds / size * 1e6,
+        **extra,
+    }
+
+
+def _trackers(hass: HomeAssistant) -> list[BboxDeviceTracker]:
+    """Return the device tracker entities of the integration."""
+    return [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        if platform.domain == Platform.DEVICE_TRACKER
+        for entity in platform.entities.values()
+    ]
+
+
+async def _setup_with_hosts(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    size: int,
+) -> float:
+    """Set up the integration with synthetic hosts, return the setup time."""
+    mock_bbox_api.get_hosts.return_value = make_hosts(size)
+    start = time.perf_counter()
+    with patch("custom_components.bbox.PLATFORMS", [Platform.DEVICE_TRACKER]):
+        await setup_integration(hass, config_entry)
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_benchmark_entity_creation(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    benchmark_results: dict[str, dict[int, dict[str, float]]],
+    size: int,
+) -> None:
+    """Benchmark setting up a device tracker per host."""
+    seconds = await _setup_with_hosts(hass, mock_config_entry, mock_bbox_api, size)
+
+    assert len(_trackers(hass)) == size
+    _record(benchmark_results, "entity_creation", size, seconds)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_benchmark_update_data(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    benchmark_results: dict[str, dict[int, dict[str, float]]],
+    size: int,
+) -> None:
+    """Benchmark fetching, indexing and diffing the hosts on a refresh."""
+    await _setup_with_hosts(hass, mock_config_entry, mock_bbox_api, size)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    host_lists = (make_hosts(size, changed_every=CHANGED_EVERY), make_hosts(size))
+
+    best = float("inf")
+    for repeat in range(REPEATS):
+        mock_bbox_api.get_hosts.return_value = host_lists[repeat % 2]
+        start = time.perf_counter()
+        coordinator.data = await coordinator._async_update_data()
+        best = min(best, time.perf_counter() - start)
+
+    assert len(coordinator.data.changed_macs) == len(range(0, size, CHANGED_EVERY))
+    _record(benchmark_results, "update_data", size, best)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_benchmark_extra_state_attributes(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    benchmark_results: dict[str, dict[int, dict[str, float]]],
+    size: int,
+) -> None:
+    """Benchmark building the state attributes of every device tracker."""
+    await _setup_with_hosts(hass, mock_config_entry, mock_bbox_api, size)
+    trackers = _trackers(hass)
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for tracker in trackers:
+            assert tracker.extra_state_attributes
+        best = min(best, time.perf_counter() - start)
+
+    _record(benchmark_results, "extra_state_attributes", size, best)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", BENCHMARK_SIZES)
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_benchmark_state_writes(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    benchmark_results: dict[str, dict[int, dict[str, float]]],
+    size: int,
+) -> None:
+    """Benchmark notifying the entities of a refresh where some hosts changed."""
+    await _setup_with_hosts(hass, mock_config_entry, mock_bbox_api, size)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    host_lists = (make_hosts(size, changed_every=CHANGED_EVERY), make_hosts(size))
+
+    state_changes = 0
+
+    @callback
+    def _count_state_change(_: Event) -> None:
+        nonlocal state_changes
+        state_changes += 1
+
+    best = float("inf")
+    for repeat in range(REPEATS):
+        mock_bbox_api.get_hosts.return_value = host_lists[repeat % 2]
+        data = await coordinator._async_update_data()
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_change)
+        state_changes = 0
+        start = time.perf_counter()
+        coordinator.async_set_updated_data(data)
+        best = min(best, time.perf_counter() - start)
+        await hass.async_block_till_done()
+        unsub()
+
+    assert state_changes == len(range(0, size, CHANGED_EVERY))
+    _record(benchmark_results, "state_writes", size, best, state_changes=state_changes)
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aiobbox.exceptions import (
     BboxApiError,
     BboxInvalidCredentialsError,
     BboxRateLimitError,
+    BboxSessionExpiredError,
     BboxTimeoutError,
 )
 from homeassistant import config_entries
@@ -17,7 +18,21 @@ from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
-from custom_components.bbox.const import CONF_BASE_URL, DOMAIN
+from custom_components.bbox.client import async_get_client_registry
+from custom_components.bbox.const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_BASE_URL,
+    CONF_DEPARTURE_GRACE,
+    CONF_DEVICE_TYPES,
+    CONF_EXCLUDE_HOSTNAMES,
+    CONF_EXCLUDE_MACS,
+    CONF_GUEST_FILTER,
+    CONF_INCLUDE_MACS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    DOMAIN,
+)
 
 if TYPE_CHECKING:
     from aiobbox.models import Router
@@ -57,6 +72,45 @@ async def test_form(hass: HomeAssistant, mock_router: Router) -> None:
     }
 
 
+async def test_form_leaves_client_in_use_to_its_entry(
+    hass: HomeAssistant, mock_router: Router
+) -> None:
+    """Test an expired client used by a loaded entry is not logged in again."""
+    shared = MagicMock(
+        authenticate=AsyncMock(),
+        get_router_info=AsyncMock(
+            side_effect=BboxSessionExpiredError("Session expired")
+        ),
+        close=AsyncMock(),
+    )
+    async_get_client_registry(hass).async_register(
+        "https://192.168.1.254/api/v1/", "test_password", shared, in_use=True
+    )
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with patch("custom_components.bbox.config_flow.BboxApi") as mock_api:
+        api_instance = mock_api.return_value
+        api_instance.authenticate = AsyncMock()
+        api_instance.get_router_info = AsyncMock(return_value=mock_router)
+        api_instance.close = AsyncMock()
+
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                CONF_BASE_URL: "https://192.168.1.254/api/v1/",
+                CONF_PASSWORD: "test_password",
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert result2["type"] is FlowResultType.CREATE_ENTRY
+    assert not shared.authenticate.called
+    assert not shared.close.called
+    assert api_instance.authenticate.call_count == 1
+
+
 @pytest.mark.parametrize(
     ("exception", "error"),
     [
@@ -197,3 +251,56 @@ async def test_reauth_flow_errors(
 
     assert result2["type"] is FlowResultType.FORM
     assert result2["errors"] == {"base": error}
+
+
+async def test_options_flow(
+    hass: HomeAssistant,
+    mock_config_entry: config_entries.ConfigEntry,
+) -> None:
+    """Test the polling and host filter options flow."""
+    mock_config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    options = {
+        CONF_SCAN_INTERVAL: 30,
+        CONF_ADAPTIVE_POLLING: True,
+        CONF_MIN_SCAN_INTERVAL: 60,
+        CONF_MAX_SCAN_INTERVAL: 10,
+        CONF_DEPARTURE_GRACE: 60,
+    }
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"], options
+    )
+    assert result2["type"] is FlowResultType.FORM
+    assert result2["errors"] == {"base": "invalid_interval"}
+
+    options[CONF_MIN_SCAN_INTERVAL] = 5
+    options[CONF_MAX_SCAN_INTERVAL] = 600
+    result3 = await hass.config_entries.options.async_configure(
+        result["flow_id"], options
+    )
+    assert result3["type"] is FlowResultType.FORM
+    assert result3["step_id"] == "filters"
+
+    filters = {
+        CONF_INCLUDE_MACS: [],
+        CONF_EXCLUDE_MACS: ["not-a-mac"],
+        CONF_EXCLUDE_HOSTNAMES: ["esp-*"],
+        CONF_GUEST_FILTER: "non_guest",
+        CONF_DEVICE_TYPES: ["Phone"],
+    }
+    result4 = await hass.config_entries.options.async_configure(
+        result["flow_id"], filters
+    )
+    assert result4["type"] is FlowResultType.FORM
+    assert result4["errors"] == {"base": "invalid_mac"}
+
+    filters[CONF_EXCLUDE_MACS] = ["AA-BB-CC-DD-EE-FF"]
+    result5 = await hass.config_entries.options.async_configure(
+        result["flow_id"], filters
+    )
+    assert result5["type"] is FlowResultType.CREATE_ENTRY
+    assert mock_config_entry.options == options | filters
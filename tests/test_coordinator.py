@@ -0,0 +1,354 @@
+"""Test the Bbox data update coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aiobbox.exceptions import (
+    BboxApiError,
+    BboxInvalidCredentialsError,
+    BboxSessionExpiredError,
+)
+from homeassistant.config_entries import SOURCE_REAUTH
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from custom_components.bbox.const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_DEPARTURE_GRACE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    DOMAIN,
+    EVENT_PRESENCE_CHANGED,
+)
+from custom_components.bbox.coordinator import BboxData
+from custom_components.bbox.host import BboxHost, host_last_seen
+
+from . import make_host, make_hosts, setup_integration
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from unittest.mock import MagicMock
+
+    from aiobbox.models import Host, Router
+
+
+@pytest.mark.usefixtures("mock_bbox_api")
+async def test_refresh_records_latency(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test each endpoint's latency is recorded on refresh."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    assert set(coordinator.api_latency) == {"router", "hosts", "wan"}
+
+
+async def test_refresh_keeps_router_on_router_failure(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_router: Router,
+) -> None:
+    """Test a router info failure reuses the previous router info."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    mock_bbox_api.get_router_info.side_effect = BboxApiError("API Error")
+    coordinator._router_fetched_at = None
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data.router is mock_router
+
+
+async def test_refresh_keeps_restored_router_on_router_failure(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_router: Router,
+    mock_host_active: Host,
+) -> None:
+    """Test a router info failure after a restore reuses the restored router."""
+    hass_storage[f"{DOMAIN}.{mock_config_entry.entry_id}"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{mock_config_entry.entry_id}",
+        "data": BboxData.from_api(mock_router, [mock_host_active]).as_dict(),
+    }
+    mock_bbox_api.get_router_info.side_effect = BboxApiError("API Error")
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    # Refreshed in the background after the restore
+    assert mock_bbox_api.get_hosts.call_count == 1
+    assert coordinator.last_update_success
+    assert coordinator.data.router.serialnumber == mock_router.serialnumber
+    # The restored router clock is used as is
+    assert coordinator.data.now == coordinator.data.router.now
+
+
+async def test_router_info_polled_less_often(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+) -> None:
+    """Test router info is not fetched again within its own interval."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert mock_bbox_api.get_router_info.call_count == 1
+    assert mock_bbox_api.get_hosts.call_count == 3
+    assert coordinator.data.now > coordinator.data.router.now
+
+
+async def test_session_expiry_logs_in_once(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_router: Router,
+    mock_host_active: Host,
+) -> None:
+    """Test concurrent session expiries share one silent login and retry."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    coordinator._router_fetched_at = None
+    mock_bbox_api.authenticate.reset_mock()
+    # Both requests are in flight before either sees its session expired
+    in_flight = asyncio.Barrier(2)
+
+    def _expire_once(result: Any) -> Callable[[], Awaitable[Any]]:
+        """Return a request failing on its first call, once both are sent."""
+        calls = 0
+
+        async def _request() -> Any:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await in_flight.wait()
+                raise BboxSessionExpiredError("Session expired")
+            return result
+
+        return _request
+
+    async def _login() -> None:
+        # Let the other request fail while the login is in progress
+        await asyncio.sleep(0)
+
+    mock_bbox_api.authenticate.side_effect = _login
+    mock_bbox_api.get_router_info.side_effect = _expire_once(mock_router)
+    mock_bbox_api.get_hosts.side_effect = _expire_once([mock_host_active])
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert mock_bbox_api.authenticate.call_count == 1
+    assert not mock_config_entry.async_get_active_flows(hass, {SOURCE_REAUTH})
+
+
+async def test_invalid_credentials_starts_reauth(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+) -> None:
+    """Test reauth only starts when the stored password is rejected."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    mock_bbox_api.get_hosts.side_effect = BboxSessionExpiredError("Session expired")
+    mock_bbox_api.authenticate.side_effect = BboxInvalidCredentialsError(
+        "Invalid password"
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert not coordinator.last_update_success
+    assert mock_config_entry.async_get_active_flows(hass, {SOURCE_REAUTH})
+
+
+async def test_refresh_fails_on_hosts_failure(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+) -> None:
+    """Test a hosts failure fails the refresh."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    mock_bbox_api.get_hosts.side_effect = BboxApiError("API Error")
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+
+
+def test_last_seen_is_stable_across_polls() -> None:
+    """Test last_seen does not move as the router clock advances."""
+    now = datetime(2025, 1, 1, 12, 1)
+    host = make_host(1, active=False).model_copy(update={"lastseen": 600})
+    later = host.model_copy(update={"lastseen": 630})
+
+    assert host_last_seen(host, now) == datetime(2025, 1, 1, 11, 50)
+    assert host_last_seen(later, now + timedelta(seconds=30)) == host_last_seen(
+        host, now
+    )
+
+
+async def test_adaptive_polling(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+) -> None:
+    """Test adaptive polling speeds up on presence changes and backs off."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_entry.data,
+        options={
+            CONF_SCAN_INTERVAL: 30,
+            CONF_ADAPTIVE_POLLING: True,
+            CONF_MIN_SCAN_INTERVAL: 5,
+            CONF_MAX_SCAN_INTERVAL: 100,
+        },
+        unique_id=mock_config_entry.unique_id,
+    )
+    await setup_integration(hass, entry)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    assert coordinator.update_interval == timedelta(seconds=60)
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=100)
+
+    arrived = mock_host_inactive.model_copy(update={"active": True})
+    mock_bbox_api.get_hosts.return_value = [mock_host_active, arrived]
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=5)
+
+
+def test_host_record_comparison() -> None:
+    """Test host records differ on every field exposed in entity state.
+
+    Their fingerprint leaves out the fields that move on nearly every poll.
+    """
+    now = datetime(2025, 1, 1, 12)
+    # A wireless host
+    host = make_hosts(2)[1]
+    record = BboxHost.from_host(host, now)
+
+    renamed = BboxHost.from_host(host.model_copy(update={"hostname": "new"}), now)
+    assert renamed != record
+    assert renamed.fingerprint != record.fingerprint
+    # Volatile fields do not mark a host changed
+    volatile = BboxHost.from_host(
+        host.model_copy(
+            update={
+                "lease": 1200,
+                "wireless": host.wireless.model_copy(
+                    update={"rssi0": -70, "estimatedRate": 144}
+                ),
+            }
+        ),
+        now,
+    )
+    assert volatile != record
+    assert volatile.fingerprint == record.fingerprint
+    assert BboxHost.from_host(host, now + timedelta(seconds=30)) == record
+    assert BboxHost.from_dict(record.as_dict()) == record
+
+
+async def test_presence_event(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+) -> None:
+    """Test one presence event lists the arrivals and departures of a refresh."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    events = async_capture_events(hass, EVENT_PRESENCE_CHANGED)
+
+    await coordinator.async_refresh()
+    assert not events
+
+    left = mock_host_active.model_copy(update={"active": False})
+    back = mock_host_inactive.model_copy(update={"active": True})
+    mock_bbox_api.get_hosts.return_value = [left, back, make_host(3)]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    data = events[0].data
+    assert data["config_entry_id"] == mock_config_entry.entry_id
+    assert sorted(host["mac"] for host in data["arrived"]) == [
+        "00:00:00:00:00:03",
+        "11:22:33:44:55:66",
+    ]
+    assert data["departed"] == [
+        {"mac": "aa:bb:cc:dd:ee:ff", "hostname": "test-device", "ip": "192.168.1.100"}
+    ]
+
+
+async def test_departure_grace(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+) -> None:
+    """Test hosts stay connected until the departure grace period has passed."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_entry.data,
+        options={CONF_DEPARTURE_GRACE: 120},
+        unique_id=mock_config_entry.unique_id,
+    )
+    await setup_integration(hass, entry)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    events = async_capture_events(hass, EVENT_PRESENCE_CHANGED)
+    mac = "aa:bb:cc:dd:ee:ff"
+
+    # Reported inactive, but seen by the router within the grace period
+    mock_bbox_api.get_hosts.return_value = [
+        mock_host_active.model_copy(update={"active": False, "lastseen": 30})
+    ]
+    await coordinator.async_refresh()
+    assert coordinator.data.hosts_by_mac[mac].active
+    assert not events
+
+    # Not seen by the router for longer than the grace period
+    mock_bbox_api.get_hosts.return_value = [
+        mock_host_active.model_copy(update={"active": False, "lastseen": 200})
+    ]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert not coordinator.data.hosts_by_mac[mac].active
+    assert [host["mac"] for host in events[-1].data["departed"]] == [mac]
+
+    # Missing from the list, held until the grace period has passed
+    mock_bbox_api.get_hosts.return_value = [mock_host_active]
+    await coordinator.async_refresh()
+    events.clear()
+    mock_bbox_api.get_hosts.return_value = []
+    await coordinator.async_refresh()
+    assert coordinator.data.hosts_by_mac[mac].active
+    coordinator._router_fetched_at -= 60
+    await coordinator.async_refresh()
+    assert coordinator.data.hosts_by_mac[mac].active
+    assert not events
+
+    coordinator._router_fetched_at -= 300
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert mac not in coordinator.data.hosts_by_mac
+    assert [host["mac"] for host in events[-1].data["departed"]] == [mac]
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import async_get_platforms
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
     snapshot_platform,
 )
 from syrupy.assertion import SnapshotAssertion
 
-from . import setup_integration
+from custom_components.bbox.const import DOMAIN
+from custom_components.bbox.device_tracker import BboxDeviceTracker, _host_attributes
+
+from . import make_host, setup_integration
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from aiobbox.models import Host
 
 
 @pytest.mark.usefixtures("mock_bbox_api", "entity_registry_enabled_by_default")
@@ -29,3 +39,148 @@ async def test_all_entities(
         await setup_integration(hass, mock_config_entry)
 
     await snapshot_platform(hass, entity_registry, snapshot, mock_config_entry.entry_id)
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_only_changed_hosts_write_state(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+) -> None:
+    """Test a refresh only writes state for trackers whose host changed."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    changed = mock_host_inactive.model_copy(update={"ipaddress": "192.168.1.102"})
+    mock_bbox_api.get_hosts.return_value = [mock_host_active, changed]
+
+    with patch.object(
+        BboxDeviceTracker, "async_write_ha_state", autospec=True
+    ) as mock_write:
+        await coordinator.async_refresh()
+
+    assert [call.args[0].mac_address for call in mock_write.call_args_list] == [
+        mock_host_inactive.macaddress
+    ]
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_new_host_adds_tracker(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test a host appearing after setup gets a tracker without a reload."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    new_host = make_host(7)
+    unique_id = new_host.macaddress.lower()
+
+    assert not entity_registry.async_get_entity_id(
+        Platform.DEVICE_TRACKER, DOMAIN, unique_id
+    )
+    logins = mock_bbox_api.authenticate.call_count
+
+    mock_bbox_api.get_hosts.return_value = [
+        mock_host_active,
+        mock_host_inactive,
+        new_host,
+    ]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    entity_id = entity_registry.async_get_entity_id(
+        Platform.DEVICE_TRACKER, DOMAIN, unique_id
+    )
+    assert entity_id
+    assert hass.states.get(entity_id).state == "home"
+    # Added by the refresh itself, not by a reload logging in again
+    assert mock_bbox_api.authenticate.call_count == logins
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_attributes_rebuilt_only_on_host_change(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+) -> None:
+    """Test tracker attributes are reused until the host changes."""
+    with patch(
+        "custom_components.bbox.device_tracker._host_attributes",
+        wraps=_host_attributes,
+    ) as mock_build:
+        await setup_integration(hass, mock_config_entry)
+        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+        tracker = next(
+            entity
+            for platform in async_get_platforms(hass, DOMAIN)
+            for entity in platform.entities.values()
+            if isinstance(entity, BboxDeviceTracker)
+            and entity.mac_address == mock_host_active.macaddress
+        )
+        attributes = tracker.extra_state_attributes
+        assert tracker.extra_state_attributes is attributes
+
+        # An unchanged host keeps its attributes across refreshes
+        await coordinator.async_refresh()
+        assert tracker.extra_state_attributes is attributes
+
+        # A lease alone does not write state, nor is it read back stale
+        renewed = mock_host_active.model_copy(update={"lease": 1800})
+        mock_bbox_api.get_hosts.return_value = [renewed, mock_host_inactive]
+        with patch.object(
+            BboxDeviceTracker, "async_write_ha_state", autospec=True
+        ) as mock_write:
+            await coordinator.async_refresh()
+        assert not mock_write.called
+        assert tracker.extra_state_attributes["lease_time"] == "0:30:00"
+
+        builds = mock_build.call_count
+        moved = mock_host_active.model_copy(
+            update={"lease": 7200, "ipaddress": "192.168.1.150"}
+        )
+        mock_bbox_api.get_hosts.return_value = [moved, mock_host_inactive]
+        await coordinator.async_refresh()
+
+        assert tracker.extra_state_attributes["lease_time"] == "2:00:00"
+        assert mock_build.call_count == builds + 1
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_attributes_fresh_on_unrelated_write(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+) -> None:
+    """Test a state write for another reason shows the latest RSSI."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    tracker = next(
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+        if isinstance(entity, BboxDeviceTracker)
+        and entity.mac_address == mock_host_active.macaddress
+    )
+    assert hass.states.get(tracker.entity_id).attributes["rssi"] == "-45 dBm"
+
+    # RSSI alone does not write state
+    weaker = mock_host_active.model_copy(
+        update={"wireless": mock_host_active.wireless.model_copy(update={"rssi0": -70})}
+    )
+    mock_bbox_api.get_hosts.return_value = [weaker, mock_host_inactive]
+    await coordinator.async_refresh()
+    assert hass.states.get(tracker.entity_id).attributes["rssi"] == "-45 dBm"
+
+    # As when another router reports a presence change
+    tracker.async_write_ha_state()
+    assert hass.states.get(tracker.entity_id).attributes["rssi"] == "-70 dBm"
@@ -0,0 +1,96 @@
+"""Test the Bbox device triggers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.components import automation
+from homeassistant.components.device_automation import DeviceAutomationType
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_get_device_automations,
+    async_mock_service,
+)
+
+from custom_components.bbox.const import DOMAIN
+
+from . import setup_integration
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from aiobbox.models import Host
+
+
+@pytest.mark.usefixtures("mock_bbox_api")
+async def test_get_triggers(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_host_active: Host,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test tracked hosts offer arrival and departure triggers, routers none."""
+    await setup_integration(hass, mock_config_entry)
+    host_device = device_registry.async_get_device(
+        connections={(dr.CONNECTION_NETWORK_MAC, mock_host_active.macaddress)}
+    )
+    router_device = device_registry.async_get_device(
+        identifiers={(DOMAIN, "TEST12345")}
+    )
+    assert host_device
+    assert router_device
+
+    triggers = await async_get_device_automations(
+        hass, DeviceAutomationType.TRIGGER, host_device.id
+    )
+    assert sorted(trigger["type"] for trigger in triggers) == ["arrived", "departed"]
+    assert not await async_get_device_automations(
+        hass, DeviceAutomationType.TRIGGER, router_device.id
+    )
+
+
+async def test_departure_trigger(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test the departure trigger fires from the presence event."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    device = device_registry.async_get_device(
+        connections={(dr.CONNECTION_NETWORK_MAC, mock_host_active.macaddress)}
+    )
+    assert device
+    calls = async_mock_service(hass, "test", "automation")
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "device",
+                    "domain": DOMAIN,
+                    "device_id": device.id,
+                    "type": "departed",
+                },
+                "action": {
+                    "service": "test.automation",
+                    "data_template": {"type": "{{ trigger.type }}"},
+                },
+            }
+        },
+    )
+
+    left = mock_host_active.model_copy(update={"active": False})
+    mock_bbox_api.get_hosts.return_value = [left, mock_host_inactive]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert [call.data["type"] for call in calls] == ["departed"]
@@ -0,0 +1,46 @@
+"""Test the Bbox diagnostics."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.diagnostics import (
+    get_diagnostics_for_config_entry,
+)
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+from custom_components.bbox.const import DOMAIN
+
+from . import setup_integration
+
+
+@pytest.mark.usefixtures("mock_bbox_api", "entity_registry_enabled_by_default")
+async def test_diagnostics(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test diagnostics redact credentials and report refresh statistics."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, mock_config_entry
+    )
+
+    assert diagnostics["entry"]["data"]["password"] == REDACTED
+    assert diagnostics["entry"]["unique_id"] == REDACTED
+    assert diagnostics["router"]["serialnumber"] == REDACTED
+    assert diagnostics["hosts"] == 2
+
+    performance = diagnostics["performance"]
+    assert performance["api_latency"]["hosts"]["count"] == 2
+    assert sum(performance["api_latency"]["hosts"]["buckets"].values()) == 2
+    assert performance["build_time"]["count"] == 2
+    assert performance["listeners_notified"]["count"] == 2
+    assert performance["state_writes"]["count"] == 2
+    assert performance["callback_time"]["count"] == 2
@@ -0,0 +1,107 @@
+"""Test the Bbox host filters."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bbox.const import (
+    CONF_EXCLUDE_HOSTNAMES,
+    CONF_EXCLUDE_MACS,
+    CONF_GUEST_FILTER,
+    DOMAIN,
+)
+from custom_components.bbox.filters import GuestFilter, HostFilter
+
+from . import make_host, setup_integration
+
+if TYPE_CHECKING:
+    from aiobbox.models import Host
+
+
+def test_no_filter() -> None:
+    """Test options without filters select every host."""
+    assert HostFilter.from_options({}) is None
+    assert (
+        HostFilter.from_options(
+            {CONF_EXCLUDE_MACS: [], CONF_GUEST_FILTER: GuestFilter.ALL}
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    ("host_filter", "kept"),
+    [
+        (HostFilter(include_macs=["00-00-00-00-00-01"]), [1]),
+        (HostFilter(exclude_macs=["00:00:00:00:00:01"]), [0, 2, 3]),
+        (HostFilter(exclude_hostnames=["HOST-[12]"]), [0, 3]),
+        (HostFilter(guest=GuestFilter.GUEST), [2]),
+        (HostFilter(guest=GuestFilter.NON_GUEST), [0, 1, 3]),
+        (HostFilter(device_types=["Phone"]), [3]),
+        (
+            HostFilter(include_macs=["00:00:00:00:00:01", "00:00:00:00:00:02"]),
+            [1, 2],
+        ),
+        (
+            HostFilter(
+                exclude_hostnames=["host-*"], include_macs=["00:00:00:00:00:01"]
+            ),
+            [],
+        ),
+    ],
+)
+def test_host_filter(host_filter: HostFilter, kept: list[int]) -> None:
+    """Test a host is kept only when it passes every filter."""
+    hosts = [
+        make_host(0),
+        make_host(1),
+        make_host(2).model_copy(update={"guest": True}),
+        make_host(3).model_copy(update={"devicetype": "Phone"}),
+    ]
+    assert [host.id for host in hosts if host_filter.matches(host)] == kept
+
+
+@pytest.mark.usefixtures("mock_bbox_api")
+async def test_filtered_hosts_not_tracked(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_host_inactive: Host,
+) -> None:
+    """Test filtered hosts are neither indexed nor given a device tracker."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=mock_config_entry.data,
+        options={CONF_EXCLUDE_MACS: [mock_host_inactive.macaddress]},
+        unique_id=mock_config_entry.unique_id,
+    )
+    await setup_integration(hass, entry)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    assert list(coordinator.data.hosts_by_mac) == ["aa:bb:cc:dd:ee:ff"]
+    assert hass.states.get("device_tracker.test_device") is not None
+    assert hass.states.get("device_tracker.offline_device") is None
+
+
+@pytest.mark.usefixtures("mock_bbox_api", "entity_registry_enabled_by_default")
+async def test_filtered_trackers_removed(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test device trackers of hosts filtered out later are removed."""
+    await setup_integration(hass, mock_config_entry)
+    assert entity_registry.async_get("device_tracker.offline_device") is not None
+
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_EXCLUDE_HOSTNAMES: ["offline-*"]}
+    )
+    await hass.config_entries.async_reload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entity_registry.async_get("device_tracker.offline_device") is None
+    assert entity_registry.async_get("device_tracker.test_device") is not None
@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from aiobbox.exceptions import BboxApiError, BboxTimeoutError
-from homeassistant.config_entries import ConfigEntryState
+from homeassistant.config_entries import SOURCE_USER, ConfigEntryState
+from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.bbox.client import async_get_client_registry
+from custom_components.bbox.const import (
+    CLIENT_RELEASE_DELAY,
+    CONF_BASE_URL,
+    DATA_SCHEDULER,
+    DOMAIN,
+)
+from custom_components.bbox.coordinator import BboxData
 
-from custom_components.bbox.const import DOMAIN
+from . import setup_integration
 
 if TYPE_CHECKING:
-    from unittest.mock import MagicMock
+    from aiobbox.models import Host, Router
 
 
 @pytest.mark.usefixtures("mock_bbox_api")
@@ -71,4 +86,124 @@ async def test_unload_entry(
     await hass.async_block_till_done()
 
     assert mock_config_entry.state is ConfigEntryState.NOT_LOADED
+    assert not mock_bbox_api.close.called
+
+    # The client is kept briefly for a reload to reuse, then closed
+    async_fire_time_changed(hass, dt_util.utcnow() + CLIENT_RELEASE_DELAY)
+    await hass.async_block_till_done()
     assert mock_bbox_api.close.called
+
+
+async def test_reload_reuses_client(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+) -> None:
+    """Test reloading an entry does not log in again."""
+    await setup_integration(hass, mock_config_entry)
+    assert mock_bbox_api.authenticate.call_count == 1
+
+    assert await hass.config_entries.async_reload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert mock_bbox_api.authenticate.call_count == 1
+    assert not mock_bbox_api.close.called
+
+
+async def test_client_in_use_not_replaced(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+) -> None:
+    """Test a client registered for a loaded entry's router waits for release."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    base_url = mock_config_entry.data[CONF_BASE_URL]
+    registry = async_get_client_registry(hass)
+
+    # As a reauth flow does, with a new password
+    new_api = MagicMock(close=AsyncMock())
+    registry.async_register(base_url, "new_password", new_api)
+    await hass.async_block_till_done()
+    assert not mock_bbox_api.close.called
+    assert coordinator.api is mock_bbox_api
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_bbox_api.close.called
+    assert registry.async_get(base_url, "new_password") is new_api
+    assert not new_api.close.called
+
+
+async def test_setup_reuses_config_flow_client(
+    hass: HomeAssistant,
+    mock_bbox_api: MagicMock,
+) -> None:
+    """Test the entry takes over the session and router info from the flow."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_BASE_URL: "https://192.168.1.254/api/v1/",
+            CONF_PASSWORD: "test_password",
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert result["result"].state is ConfigEntryState.LOADED
+    assert mock_bbox_api.authenticate.call_count == 1
+    assert mock_bbox_api.get_router_info.call_count == 1
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_setup_entry_from_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_router: Router,
+    mock_host_active: Host,
+) -> None:
+    """Test setup uses the persisted snapshot when the router is unreachable."""
+    hass_storage[f"{DOMAIN}.{mock_config_entry.entry_id}"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{mock_config_entry.entry_id}",
+        "data": BboxData.from_api(mock_router, [mock_host_active]).as_dict(),
+    }
+    mock_config_entry.add_to_hass(hass)
+    mock_bbox_api.authenticate.side_effect = BboxTimeoutError("Timeout", timeout=10.0)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert hass.states.get("device_tracker.test_device") is not None
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert not coordinator.last_update_success
+
+
+async def test_remove_entry_removes_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_router: Router,
+) -> None:
+    """Test removing an entry removes its snapshot without a coordinator."""
+    key = f"{DOMAIN}.{mock_config_entry.entry_id}"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": BboxData.from_api(mock_router, []).as_dict(),
+    }
+    mock_config_entry.add_to_hass(hass)
+
+    await hass.config_entries.async_remove(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert key not in hass_storage
+    assert DATA_SCHEDULER not in hass.data
@@ -0,0 +1,142 @@
+"""Test the Bbox integration over HTTP against a fake router.
+
+The HTTP tests run by default. The load and soak tests are marked `soak` and
+deselected by default, run them with `pytest -m soak`.
+"""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bbox.const import DOMAIN
+
+from . import make_hosts, setup_integration
+from .fake_bbox import FakeBbox
+
+# The fake router is served on a local socket
+pytestmark = pytest.mark.usefixtures(
+    "socket_enabled", "entity_registry_enabled_by_default"
+)
+
+
+async def test_setup_over_http(
+    hass: HomeAssistant,
+    fake_bbox: FakeBbox,
+    fake_bbox_config_entry: MockConfigEntry,
+) -> None:
+    """Test the integration logs in once and tracks the hosts of the router."""
+    await setup_integration(hass, fake_bbox_config_entry)
+
+    state = hass.states.get("device_tracker.test_device")
+    assert state
+    assert state.state == "home"
+    assert state.attributes["ip"] == "192.168.1.100"
+    assert fake_bbox.logins == 1
+    assert fake_bbox.requests["hosts"] == 1
+
+
+async def test_session_expiry_over_http(
+    hass: HomeAssistant,
+    fake_bbox: FakeBbox,
+    fake_bbox_config_entry: MockConfigEntry,
+) -> None:
+    """Test an expired session cookie is renewed with a single login."""
+    await setup_integration(hass, fake_bbox_config_entry)
+    coordinator = hass.data[DOMAIN][fake_bbox_config_entry.entry_id]
+
+    fake_bbox.expire_sessions()
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert fake_bbox.logins == 2
+
+    # WAN stats share the session and renew it the same way
+    fake_bbox.expire_sessions()
+    await coordinator.wan.async_refresh()
+
+    assert coordinator.wan.last_update_success
+    assert fake_bbox.logins == 3
+
+
+async def test_rate_limited_login_over_http(
+    hass: HomeAssistant,
+    fake_bbox: FakeBbox,
+    fake_bbox_config_entry: MockConfigEntry,
+) -> None:
+    """Test a rate limited login fails the refresh and backs off."""
+    await setup_integration(hass, fake_bbox_config_entry)
+    coordinator = hass.data[DOMAIN][fake_bbox_config_entry.entry_id]
+
+    fake_bbox.login_rate_limit = 1
+    fake_bbox.expire_sessions()
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator.failures == 1
+    assert fake_bbox.errors["login"] == 1
+
+
+@pytest.mark.soak
+async def test_load(
+    hass: HomeAssistant,
+    fake_bbox: FakeBbox,
+    fake_bbox_config_entry: MockConfigEntry,
+) -> None:
+    """Test refreshes of a large network through a slow, flaky router."""
+    fake_bbox.hosts = make_hosts(1000)
+    await setup_integration(hass, fake_bbox_config_entry)
+    coordinator = hass.data[DOMAIN][fake_bbox_config_entry.entry_id]
+
+    fake_bbox.latency = 0.01
+    fake_bbox.jitter = 0.02
+    fake_bbox.error_rate = 0.05
+    fake_bbox.session_lifetime = 0.5
+    successes = 0
+    for _ in range(50):
+        await coordinator.async_refresh()
+        successes += coordinator.last_update_success
+        await hass.async_block_till_done()
+
+    assert successes >= 40
+    assert len(hass.states.async_entity_ids("device_tracker")) == 1000
+
+
+@pytest.mark.soak
+async def test_soak(
+    hass: HomeAssistant,
+    fake_bbox: FakeBbox,
+    fake_bbox_config_entry: MockConfigEntry,
+) -> None:
+    """Test tracker states follow a churning network across many refreshes."""
+    hosts = make_hosts(200)
+    fake_bbox.hosts = hosts
+    await setup_integration(hass, fake_bbox_config_entry)
+    coordinator = hass.data[DOMAIN][fake_bbox_config_entry.entry_id]
+
+    fake_bbox.jitter = 0.005
+    fake_bbox.error_rate = 0.02
+    fake_bbox.session_lifetime = 1.0
+    for refresh in range(500):
+        # Flip the presence of a rotating tenth of the hosts
+        fake_bbox.hosts = [
+            host.model_copy(update={"active": not host.active})
+            if index % 10 == refresh % 10
+            else host
+            for index, host in enumerate(fake_bbox.hosts)
+        ]
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    fake_bbox.error_rate = 0
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    for host in fake_bbox.hosts:
+        tracked = coordinator.data.get_host(host.macaddress)
+        assert tracked is not None
+        assert tracked.active == host.active
+    assert len(coordinator.data.hosts_by_mac) == len(hosts)
+    assert fake_bbox.logins > 1
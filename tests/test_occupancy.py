@@ -0,0 +1,95 @@
+"""Test the Bbox network occupancy aggregation."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from aiobbox.models import Host, WirelessInfo
+
+from custom_components.bbox.host import BboxHost
+from custom_components.bbox.occupancy import NetworkOccupancy, top_talkers
+
+from . import make_host
+
+NOW = datetime(2025, 1, 1, 12)
+
+
+def _records(hosts: list[Host]) -> list[BboxHost]:
+    """Return the records built from hosts on each refresh."""
+    return [BboxHost.from_host(host, NOW) for host in hosts]
+
+
+def _wireless(band: float, rssi: int, usage: int = 0) -> WirelessInfo:
+    """Return wireless info on a band with an RSSI and transmit usage."""
+    return WirelessInfo(
+        wexindex=1,
+        static=False,
+        band=band,
+        txUsage=usage,
+        rxUsage=0,
+        estimatedRate=100,
+        rssi0=rssi,
+        mcs=9,
+        rate=100,
+    )
+
+
+def test_occupancy() -> None:
+    """Test counts and signal statistics over the host list."""
+    hosts = [
+        make_host(1).model_copy(update={"wireless": _wireless(5.0, -40)}),
+        make_host(2).model_copy(update={"wireless": _wireless(5.0, -80)}),
+        make_host(3).model_copy(
+            update={"wireless": _wireless(2.4, -60), "guest": True}
+        ),
+        make_host(4).model_copy(update={"link": "Ethernet"}),
+        make_host(5, active=False).model_copy(update={"link": "Ethernet"}),
+    ]
+
+    occupancy = NetworkOccupancy(_records(hosts))
+
+    assert occupancy.connected == 4
+    assert occupancy.wired == 1
+    assert occupancy.wireless == 3
+    assert occupancy.guest == 1
+    assert occupancy.weak_signal == 1
+    assert occupancy.bands["5ghz"].devices == 2
+    assert occupancy.bands["5ghz"].rssi_mean == -60
+    assert occupancy.bands["5ghz"].rssi_min == -80
+    assert occupancy.bands["2_4ghz"].devices == 1
+    assert occupancy.bands["6ghz"].devices == 0
+    assert occupancy.bands["6ghz"].rssi_mean is None
+
+
+def test_top_talkers() -> None:
+    """Test hosts are ranked by usage, skipping idle and inactive ones."""
+    hosts = _records(
+        [
+            make_host(index, active=index != 4).model_copy(
+                update={"wireless": _wireless(5.0, -50, usage)}
+            )
+            for index, usage in ((1, 10), (2, 30), (3, 0), (4, 50), (5, 20))
+        ]
+    )
+
+    assert [talker["name"] for talker in top_talkers(hosts)] == [
+        "host-2",
+        "host-5",
+        "host-1",
+    ]
+    assert top_talkers(hosts, 2) == [
+        {
+            "mac": "00:00:00:00:00:02",
+            "name": "host-2",
+            "tx_usage": 30,
+            "rx_usage": 0,
+            "usage": 30,
+        },
+        {
+            "mac": "00:00:00:00:00:05",
+            "name": "host-5",
+            "tx_usage": 20,
+            "rx_usage": 0,
+            "usage": 20,
+        },
+    ]
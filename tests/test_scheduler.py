@@ -0,0 +1,175 @@
+"""Test the Bbox polling scheduler shared by config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import CONF_PASSWORD, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from custom_components.bbox.const import (
+    CONF_BASE_URL,
+    DATA_SCHEDULER,
+    DOMAIN,
+    EVENT_PRESENCE_CHANGED,
+    MAX_CONCURRENT_REQUESTS,
+)
+from custom_components.bbox.scheduler import BboxScheduler
+
+from . import setup_integration
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from aiobbox.models import Host
+
+
+async def test_polls_staggered(hass: HomeAssistant) -> None:
+    """Test entries poll at evenly spread slots of the interval."""
+    scheduler = BboxScheduler(hass)
+    interval = timedelta(seconds=30)
+    assert scheduler.next_interval("a", interval) == interval
+
+    for entry_id in ("a", "b", "c"):
+        scheduler.async_register(entry_id)
+
+    phases = []
+    for entry_id in ("a", "b", "c"):
+        now = hass.loop.time()
+        delay = scheduler.next_interval(entry_id, interval).total_seconds()
+        assert 15 <= delay < 45
+        phases.append(round((now + delay) % 30) % 30)
+    assert phases == [0, 10, 20]
+
+    scheduler.async_unregister("b")
+    now = hass.loop.time()
+    delay = scheduler.next_interval("c", interval).total_seconds()
+    assert round((now + delay) % 30) % 30 == 15
+
+
+@pytest.mark.usefixtures("mock_bbox_api")
+async def test_requests_capped(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test router requests in flight are capped."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    in_flight = peak = 0
+
+    async def _request() -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    await asyncio.gather(
+        *(coordinator._async_timed("hosts", _request) for _ in range(10))
+    )
+    assert peak == MAX_CONCURRENT_REQUESTS
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_presence_merged_across_routers(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test a host stays connected while any router reports it active.
+
+    Presence events follow the merged presence, so a host moving from one
+    router to the other neither departs nor arrives.
+    """
+    extender_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Bbox Extender",
+        data={
+            CONF_BASE_URL: "https://192.168.1.253/api/v1/",
+            CONF_PASSWORD: "test_password",
+        },
+        unique_id="TEST67890",
+    )
+    with patch("custom_components.bbox.PLATFORMS", [Platform.DEVICE_TRACKER]):
+        await setup_integration(hass, mock_config_entry)
+        await setup_integration(hass, extender_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    extender = hass.data[DOMAIN][extender_entry.entry_id]
+
+    # Hosts seen by both routers are tracked once
+    assert not er.async_entries_for_config_entry(
+        entity_registry, extender_entry.entry_id
+    )
+    assert hass.states.get("device_tracker.test_device").state == "home"
+
+    events = async_capture_events(hass, EVENT_PRESENCE_CHANGED)
+
+    left = mock_host_active.model_copy(update={"active": False})
+    mock_bbox_api.get_hosts.return_value = [left, mock_host_inactive]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get("device_tracker.test_device").state == "home"
+    assert not events
+
+    await extender.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get("device_tracker.test_device").state == "not_home"
+    assert len(events) == 1
+    assert events[0].data["config_entry_id"] == extender_entry.entry_id
+    assert [host["mac"] for host in events[0].data["departed"]] == ["aa:bb:cc:dd:ee:ff"]
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_unload_departs_hosts(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+) -> None:
+    """Test hosts only an unloaded router reported depart.
+
+    The scheduler is dropped with the last entry, without departures.
+    """
+    extender_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Bbox Extender",
+        data={
+            CONF_BASE_URL: "https://192.168.1.253/api/v1/",
+            CONF_PASSWORD: "test_password",
+        },
+        unique_id="TEST67890",
+    )
+    with patch("custom_components.bbox.PLATFORMS", [Platform.DEVICE_TRACKER]):
+        await setup_integration(hass, mock_config_entry)
+        await setup_integration(hass, extender_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    left = mock_host_active.model_copy(update={"active": False})
+    mock_bbox_api.get_hosts.return_value = [left, mock_host_inactive]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_PRESENCE_CHANGED)
+
+    await hass.config_entries.async_unload(extender_entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get("device_tracker.test_device").state == "not_home"
+    assert len(events) == 1
+    assert events[0].data["config_entry_id"] == extender_entry.entry_id
+    assert events[0].data["arrived"] == []
+    assert [host["mac"] for host in events[0].data["departed"]] == ["aa:bb:cc:dd:ee:ff"]
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert DATA_SCHEDULER not in hass.data
@@ -0,0 +1,221 @@
+"""Test the Bbox sensors."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from aiobbox.exceptions import BboxApiError, BboxRateLimitError
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bbox.const import (
+    BACKOFF_JITTER,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_PROBE_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    RATE_LIMIT_BACKOFF,
+)
+
+from . import setup_integration, wan_stats
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from aiobbox.models import Host, Router
+
+
+def _sensor_state(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry, key: str
+) -> str:
+    """Return the state of a router sensor by key."""
+    entity_id = entity_registry.async_get_entity_id(
+        Platform.SENSOR, DOMAIN, f"TEST12345_{key}"
+    )
+    assert entity_id
+    state = hass.states.get(entity_id)
+    assert state
+    return state.state
+
+
+def _breaker_state(hass: HomeAssistant, entity_registry: er.EntityRegistry) -> str:
+    """Return the state of the circuit breaker sensor."""
+    return _sensor_state(hass, entity_registry, "circuit_breaker")
+
+
+@pytest.mark.usefixtures("mock_bbox_api", "entity_registry_enabled_by_default")
+async def test_router_sensors(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_router: Router,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test router sensors are read from the polled router info."""
+    await setup_integration(hass, mock_config_entry)
+
+    boot = dt_util.as_utc(mock_router.now) - timedelta(seconds=mock_router.uptime)
+    assert _sensor_state(hass, entity_registry, "uptime") == (
+        boot.replace(second=0, microsecond=0).isoformat()
+    )
+    assert _sensor_state(hass, entity_registry, "number_of_boots") == "10"
+    assert _sensor_state(hass, entity_registry, "firmware_version") == "1.0.0"
+
+
+@pytest.mark.usefixtures("mock_bbox_api", "entity_registry_enabled_by_default")
+async def test_occupancy_sensors(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test occupancy sensors aggregate the polled hosts."""
+    await setup_integration(hass, mock_config_entry)
+
+    assert _sensor_state(hass, entity_registry, "connected_devices") == "1"
+    assert _sensor_state(hass, entity_registry, "wireless_devices") == "1"
+    assert _sensor_state(hass, entity_registry, "wired_devices") == "0"
+    assert _sensor_state(hass, entity_registry, "wifi_5ghz_devices") == "1"
+    assert _sensor_state(hass, entity_registry, "wifi_5ghz_rssi_mean") == "-45.0"
+    assert _sensor_state(hass, entity_registry, "wifi_2_4ghz_rssi_min") == "unknown"
+
+
+@pytest.mark.usefixtures("mock_bbox_api", "entity_registry_enabled_by_default")
+async def test_top_talker_sensor(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the top talker sensor ranks the hosts by Wi-Fi usage."""
+    await setup_integration(hass, mock_config_entry)
+
+    entity_id = entity_registry.async_get_entity_id(
+        Platform.SENSOR, DOMAIN, "TEST12345_top_talker"
+    )
+    assert entity_id
+    state = hass.states.get(entity_id)
+    assert state
+    assert state.state == "test-device"
+    assert state.attributes["top_talkers"] == [
+        {
+            "mac": "aa:bb:cc:dd:ee:ff",
+            "name": "test-device",
+            "tx_usage": 10,
+            "rx_usage": 20,
+            "usage": 30,
+        }
+    ]
+
+
+@pytest.mark.usefixtures("mock_bbox_api", "entity_registry_enabled_by_default")
+async def test_boot_time_is_stable(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_router: Router,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the boot time does not move as the uptime counts up."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    before = _sensor_state(hass, entity_registry, "uptime")
+
+    coordinator._router = mock_router.model_copy(
+        update={
+            "now": mock_router.now + timedelta(seconds=30),
+            "uptime": mock_router.uptime + 30,
+        }
+    )
+    await coordinator.async_refresh()
+
+    assert _sensor_state(hass, entity_registry, "uptime") == before
+
+
+async def test_circuit_breaker(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the breaker opens after repeated failures and closes on recovery."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert _breaker_state(hass, entity_registry) == "closed"
+
+    mock_bbox_api.get_hosts.side_effect = BboxApiError("API Error")
+    await coordinator.async_refresh()
+    # A failing router is never polled faster than a healthy one
+    assert (
+        DEFAULT_SCAN_INTERVAL
+        <= coordinator.update_interval
+        <= DEFAULT_SCAN_INTERVAL * (1 + BACKOFF_JITTER)
+    )
+    assert _breaker_state(hass, entity_registry) == "closed"
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        await coordinator.async_refresh()
+    assert coordinator.update_interval == BREAKER_PROBE_INTERVAL
+    assert _breaker_state(hass, entity_registry) == "open"
+
+    # WAN stats are not polled while the breaker is open
+    mock_bbox_api.get_wan_ip_stats.reset_mock()
+    await coordinator.wan.async_refresh()
+    assert not mock_bbox_api.get_wan_ip_stats.called
+    assert not coordinator.wan.last_update_success
+
+    # The probe fails, hosts are not polled
+    mock_bbox_api.get_router_info.side_effect = BboxApiError("API Error")
+    mock_bbox_api.get_hosts.reset_mock()
+    await coordinator.async_refresh()
+    assert not mock_bbox_api.get_hosts.called
+    assert _breaker_state(hass, entity_registry) == "open"
+
+    mock_bbox_api.get_router_info.side_effect = None
+    mock_bbox_api.get_hosts.side_effect = None
+    mock_bbox_api.get_hosts.return_value = [mock_host_active]
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.update_interval == DEFAULT_SCAN_INTERVAL
+    assert _breaker_state(hass, entity_registry) == "closed"
+
+
+async def test_rate_limit_backoff(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+) -> None:
+    """Test rate limiting backs off for longer than a regular failure."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    mock_bbox_api.get_hosts.side_effect = BboxRateLimitError("Rate limit")
+    await coordinator.async_refresh()
+
+    assert (
+        RATE_LIMIT_BACKOFF
+        <= coordinator.update_interval
+        <= RATE_LIMIT_BACKOFF * (1 + BACKOFF_JITTER)
+    )
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_wan_throughput_sensors(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test WAN throughput is derived from two counter samples."""
+    await setup_integration(hass, mock_config_entry)
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert _sensor_state(hass, entity_registry, "bandwidth_down") == "unknown"
+
+    mock_bbox_api.get_wan_ip_stats.return_value = wan_stats(2_000_000, 500_000)
+    await coordinator.wan.async_refresh()
+    await hass.async_block_till_done()
+
+    assert float(_sensor_state(hass, entity_registry, "bandwidth_down")) > 0
+    assert float(_sensor_state(hass, entity_registry, "bandwidth_up_peak")) == 0
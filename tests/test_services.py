@@ -0,0 +1,59 @@
+"""Test the Bbox services."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bbox.const import DOMAIN, SERVICE_GET_USAGE_RANKING
+
+from . import setup_integration
+
+
+@pytest.mark.usefixtures("mock_bbox_api")
+async def test_get_usage_ranking(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test the usage ranking lists every host with Wi-Fi usage."""
+    await setup_integration(hass, mock_config_entry)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_USAGE_RANKING,
+        {ATTR_CONFIG_ENTRY_ID: mock_config_entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        "hosts": [
+            {
+                "mac": "aa:bb:cc:dd:ee:ff",
+                "name": "test-device",
+                "tx_usage": 10,
+                "rx_usage": 20,
+                "usage": 30,
+            }
+        ]
+    }
+
+
+@pytest.mark.usefixtures("mock_bbox_api")
+async def test_get_usage_ranking_entry_not_loaded(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test the usage ranking rejects an entry that is not loaded."""
+    await setup_integration(hass, mock_config_entry)
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_USAGE_RANKING,
+            {ATTR_CONFIG_ENTRY_ID: mock_config_entry.entry_id},
+            blocking=True,
+            return_response=True,
+        )
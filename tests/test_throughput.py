@@ -0,0 +1,54 @@
+"""Test the Bbox WAN throughput ring buffer."""
+
+from __future__ import annotations
+
+from custom_components.bbox.throughput import COUNTER_32_BIT, CounterRingBuffer
+
+
+def test_rates() -> None:
+    """Test current, average and peak rates over the buffer."""
+    buffer = CounterRingBuffer(size=3)
+    assert buffer.rates().current is None
+
+    buffer.add(0, 0)
+    buffer.add(10, 1000)
+    buffer.add(20, 3000)
+    buffer.add(40, 4000)
+
+    rates = buffer.rates()
+    assert rates.current == 50
+    assert rates.average == 4000 / 40
+    assert rates.peak == 200
+
+
+def test_ring_buffer_drops_oldest() -> None:
+    """Test the buffer only averages over its last intervals."""
+    buffer = CounterRingBuffer(size=2)
+    for timestamp, counter in ((0, 0), (10, 10_000), (20, 10_100), (30, 10_200)):
+        buffer.add(timestamp, counter)
+
+    rates = buffer.rates()
+    assert rates.average == 10
+    assert rates.peak == 10
+
+
+def test_counter_wrap() -> None:
+    """Test a 32-bit counter wrap is corrected."""
+    buffer = CounterRingBuffer(size=3)
+    buffer.add(0, COUNTER_32_BIT - 500)
+    buffer.add(10, 500)
+
+    assert buffer.rates().current == 100
+
+
+def test_counter_reset_on_reboot() -> None:
+    """Test the interval spanning a reboot is dropped."""
+    buffer = CounterRingBuffer(size=3)
+    buffer.add(0, 0)
+    buffer.add(10, 1000)
+    buffer.add(20, 200)
+    buffer.add(30, 1200)
+
+    rates = buffer.rates()
+    assert rates.current == 100
+    assert rates.average == 2000 / 20
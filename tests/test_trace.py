@@ -0,0 +1,133 @@
+"""Test recording and replaying Bbox traces."""
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from aiobbox.exceptions import BboxApiError
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bbox.const import DOMAIN, SERVICE_START_TRACE, SERVICE_STOP_TRACE
+from custom_components.bbox.trace import REDACTED, _redact, read_trace
+
+from . import setup_integration
+from .replay import async_replay
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from aiobbox.models import Host
+
+
+async def _record_trace(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+) -> Path:
+    """Record a trace of a host leaving, a failed poll and the host coming back."""
+    await setup_integration(hass, config_entry)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    service_data = {ATTR_CONFIG_ENTRY_ID: config_entry.entry_id}
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_TRACE, service_data, blocking=True
+    )
+
+    # Fetch router info again so that the trace holds one
+    coordinator._router_fetched_at = None
+    left = mock_host_active.model_copy(update={"active": False})
+    mock_bbox_api.get_hosts.side_effect = [
+        [mock_host_active, mock_host_inactive],
+        [left, mock_host_inactive],
+        BboxApiError("API Error"),
+        [mock_host_active, mock_host_inactive],
+    ]
+    for _ in range(4):
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_TRACE, service_data, blocking=True, return_response=True
+    )
+    assert response is not None
+    assert response["records"] == 5
+    return Path(str(response["path"]))
+
+
+async def test_record_and_replay(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    mock_config_entry: MockConfigEntry,
+    mock_bbox_api: MagicMock,
+    mock_host_active: Host,
+    mock_host_inactive: Host,
+) -> None:
+    """Test a recorded trace replays the same state transitions."""
+    hass.config.config_dir = str(tmp_path)
+    path = await _record_trace(
+        hass, mock_config_entry, mock_bbox_api, mock_host_active, mock_host_inactive
+    )
+
+    records = read_trace(path)
+    assert Counter(record["e"] for record in records) == {"router": 1, "hosts": 4}
+    router = next(record for record in records if record["e"] == "router")
+    assert router["d"]["serialnumber"] == REDACTED
+    assert records[-2]["x"] == "BboxApiError"
+
+    await hass.config_entries.async_remove(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    replay_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=mock_config_entry.title,
+        data=mock_config_entry.data,
+        unique_id=mock_config_entry.unique_id,
+    )
+    transitions = await async_replay(hass, replay_entry, path)
+
+    assert [
+        (old, new)
+        for _, entity_id, old, new in transitions
+        if entity_id == "device_tracker.test_device"
+    ] == [
+        (None, "home"),
+        ("home", "not_home"),
+        ("not_home", "unavailable"),
+        ("unavailable", "home"),
+    ]
+
+
+def test_redact_nested_identifiers() -> None:
+    """Test identifiers are redacted at any depth, whatever their case."""
+    response = {
+        "serialnumber": "TEST12345",
+        "hosts": [{"serialNumber": "HOST1", "DUID": "00:01", "hostname": "phone"}],
+    }
+
+    assert _redact(response) == {
+        "serialnumber": REDACTED,
+        "hosts": [{"serialNumber": REDACTED, "DUID": REDACTED, "hostname": "phone"}],
+    }
+
+
+@pytest.mark.usefixtures("mock_bbox_api")
+async def test_stop_trace_not_running(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test stopping a trace that is not running is rejected."""
+    await setup_integration(hass, mock_config_entry)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_STOP_TRACE,
+            {ATTR_CONFIG_ENTRY_ID: mock_config_entry.entry_id},
+            blocking=True,
+            return_response=True,
+        )